@@ -50,7 +50,8 @@ class Devices:
     """Make and store devices.
 
     This class contains many functions for making devices and ports.
-    It stores all the devices in a list.
+    It stores all the devices in a list, and indexes them by device ID in
+    the devices_by_id dictionary.
 
     Parameters
     ----------
@@ -111,6 +112,7 @@ class Devices:
         self.names = names
 
         self.devices_list = []
+        self.devices_by_id = {}
 
         gate_strings = ["AND", "OR", "NAND", "NOR", "XOR"]
         device_strings = ["CLOCK", "SWITCH", "DTYPE", "SIGGEN"]
@@ -137,10 +139,7 @@ class Devices:
 
     def get_device(self, device_id):
         """Return the Device object corresponding to device_id."""
-        for device in self.devices_list:
-            if device.device_id == device_id:
-                return device
-        return None
+        return self.devices_by_id.get(device_id)
 
     def find_devices(self, device_kind=None):
         """Return a list of device IDs of the specified device_kind.
@@ -161,6 +160,8 @@ class Devices:
         new_device = Device(device_id)
         new_device.device_kind = device_kind
         self.devices_list.append(new_device)
+        # The first device added with this ID is the one found by get_device
+        self.devices_by_id.setdefault(device_id, new_device)
 
     def add_input(self, device_id, input_id):
         """Add the specified input to the specified device.
@@ -275,7 +276,7 @@ class Devices:
 
         for input_number in range(1, no_of_inputs + 1):
             input_name = "".join(["I", str(input_number)])
-            [input_id] = self.names.lookup([input_name])
+            input_id = self.names.lookup_one(input_name)
             self.add_input(device_id, input_id)
 
     def make_d_type(self, device_id):
@@ -17,12 +17,29 @@ StatusBar - tiny display with instructions/messages for the user
 
 """
 
+import os
 import wx
 import wx.stc
 import wx.glcanvas as wxcanvas
 import numpy as np
 import math
+import ctypes
+import OpenGL
+
+# PyOpenGL checks for errors after every call and validates the arrays passed
+# to it. This is only worth its cost while debugging, so it is turned off
+# unless LOGSIM_GL_DEBUG is set. These must be set before OpenGL.GL is
+# imported.
+if not os.environ.get('LOGSIM_GL_DEBUG'):
+    OpenGL.ERROR_CHECKING = False
+    OpenGL.ERROR_LOGGING = False
+    OpenGL.ARRAY_SIZE_CHECKING = False
+    OpenGL.STORE_POINTERS = False
+
 from OpenGL import GL, GLU, GLUT
+# Text is drawn label by label, so these are bound once at import
+from OpenGL.GL import (glCallLists, glColor3f, glColor3fv, glDisable,
+                       glEnable, glListBase, glRasterPos2f, glRasterPos3f)
 from pathlib import Path
 
 from names import Names
@@ -32,6 +49,28 @@ from monitors import Monitors
 from scanner import Scanner
 from parse import Parser
 
+# Vertices of a cuboid spanning -1 to 1 along x and z and 0 to 1 along y,
+# four per face, each followed by the normal of its face.
+UNIT_CUBOID = np.array([
+    [-1, 0, -1, 0, -1, 0], [1, 0, -1, 0, -1, 0],
+    [1, 0, 1, 0, -1, 0], [-1, 0, 1, 0, -1, 0],
+    [1, 1, -1, 0, 1, 0], [-1, 1, -1, 0, 1, 0],
+    [-1, 1, 1, 0, 1, 0], [1, 1, 1, 0, 1, 0],
+    [-1, 1, -1, -1, 0, 0], [-1, 0, -1, -1, 0, 0],
+    [-1, 0, 1, -1, 0, 0], [-1, 1, 1, -1, 0, 0],
+    [1, 0, -1, 1, 0, 0], [1, 1, -1, 1, 0, 0],
+    [1, 1, 1, 1, 0, 0], [1, 0, 1, 1, 0, 0],
+    [-1, 0, -1, 0, 0, -1], [-1, 1, -1, 0, 0, -1],
+    [1, 1, -1, 0, 0, -1], [1, 0, -1, 0, 0, -1],
+    [-1, 1, 1, 0, 0, 1], [-1, 0, 1, 0, 0, 1],
+    [1, 0, 1, 0, 0, 1], [1, 1, 1, 0, 0, 1]], dtype=np.float32)
+
+# Layout of a cuboid vertex in the vertex buffer. Every face has its own
+# normal, so vertices cannot be shared between faces, but the normals are
+# packed into bytes (padded to four for alignment) rather than floats.
+CUBOID_VERTEX = np.dtype([('position', np.float32, 3),
+                          ('normal', np.int8, 4)])
+
 
 class Gui(wx.Frame):
     """Configure the main window and both tabs.
@@ -95,6 +134,7 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     zoom: holds the zoom of the view
     last_mouse_x:  previous x-coordinate held by cursor
     last_mouse_y: previous y-coordinate held by cursor
+    refresh_timer: coalesces repaints requested by mouse events
 
     mat_diffuse: describes matt surface
     mat_no_specular: describes matt surface with no mirror-like reflections
@@ -112,25 +152,69 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     scene_rotate: 4x4 matrix describing scene rotation
     depth_offset: offset between viewpoint and origin of the scene
+    empty_frame: whether the last frame drawn had no signals, so repainting
+                 it can be skipped until the traces or size change
+    vbo: vertex buffer object holding the signal traces
+    axis_vbo: vertex buffer object holding the axis drawn under 2D traces
+    axis_cycles: number of periods of the axis held in axis_vbo
+    font_2D: first display list of the font used in 2D view
+    font_3D: first display list of the font used in 3D view
+    tick_labels_2D: display list holding the tick labels of a 2D axis
+    tick_labels_cycles: number of cycles the tick labels were compiled for
+    projection_key: view mode and canvas size of the current projection
+    traces_epoch: incremented whenever the monitored signals change
+    label_cache: name of each signal drawn, by device and output ID
+    traces_key: epoch and dimension of the traces held in the vertex buffer
+    traces_2D: layout of the 2D traces held in the vertex buffer
+    traces_3D: layout of the 3D traces held in the vertex buffer
+    tick_positions_2D: x coordinates of the ticks of the last 2D axis built
 
     Public methods
     --------------
     init_gl(self): Configures the OpenGL context.
 
+    init_gl_static(self): Sets up the OpenGL state shared by every render.
+
     init_gl_2D(self): Configures the 2D view mode.
 
     init_gl_3D(self): Configures the 3D view mode.
 
+    get_modelview_matrix(self, x, y, z, rotation): Returns the modelview
+        matrix of the current view.
+
     render(self, text): Handles all drawing operations.
 
     get_signal_traces(self): Draws all signal traces.
 
+    get_signal_label(self, device_id, output_id): Returns the name of a
+        monitored signal.
+
     get_2D_signal_traces(self): Draws traces in 2D view mode.
 
+    upload_2D_signal_traces(self): Uploads the vertices of the 2D traces and
+        axis to their vertex buffers.
+
+    get_2D_tick_positions(self, cycles): Returns the x coordinates of the
+        ticks of a 2D axis.
+
+    get_2D_tick_labels(self, cycles): Returns the display list labelling
+        the ticks of a 2D axis.
+
+    get_2D_axis_vertices(self, cycles): Returns the vertices of a 2D axis.
+
+    get_2D_trace_vertices(self, traces): Returns the vertices of the 2D
+        signal traces, split into line strips.
+
     get_3D_signal_traces(self): Draws traces in 3D view mode.
 
-    draw_cuboid(self, x_pos, z_pos, half_width, half_depth, height): Draws
-        cuboid - building block of 3D traces
+    upload_3D_signal_traces(self): Uploads the vertices of the 3D traces to
+        the vertex buffer.
+
+    invalidate_traces(self): Forces the traces to be rebuilt on the next
+        render.
+
+    get_cuboid_vertices(self, x_pos, z_pos, half_width, half_depth, height):
+        Returns the vertices of cuboids - building blocks of 3D traces.
 
     on_paint(self, event): Handles the paint event.
 
@@ -138,11 +222,21 @@ class MyGLCanvas(wxcanvas.GLCanvas):
 
     on_mouse(self, event): Handles mouse events.
 
+    get_rotation_matrix(self, angle, x, y, z): Returns the matrix of a
+        rotation by angle degrees about the axis (x, y, z).
+
+    request_refresh(self): Requests a repaint, coalescing bursts of requests.
+
+    on_refresh_timer(self, event): Handles the refresh timer event.
+
     render_text_2D(self, text, x_pos, y_pos, colour): Handles text drawing
                                               operations in 2D view.
 
     render_text_3D(self, text, x_pos, y_pos, z_pos, colour): Handles text
                                             drawing operations in 3D view.
+
+    compile_font(self, font): Compiles display lists drawing the characters
+                              of a GLUT bitmap font.
     """
 
     def __init__(self, parent, names, devices, monitors):
@@ -180,10 +274,14 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         # Initialise variables for zooming
         self.zoom = 1
 
+        # Timer coalescing repaints requested by mouse events
+        self.refresh_timer = wx.Timer(self)
+
         # Bind events to widgets
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_SIZE, self.on_size)
         self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
+        self.Bind(wx.EVT_TIMER, self.on_refresh_timer, self.refresh_timer)
 
         # 3D View parameters for lighting and surfaces
         self.mat_diffuse = [0.0, 0.0, 0.0, 1.0]
@@ -206,58 +304,63 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         # Offset between viewpoint and origin of the scene
         self.depth_offset = 1000
 
+        # Whether the canvas shows a frame without any signals
+        self.empty_frame = False
+
+        # Vertex buffer object and font display lists, created once the
+        # context is current
+        self.vbo = None
+        self.axis_vbo = None
+        self.font_2D = None
+        self.font_3D = None
+        self.tick_labels_2D = None
+        self.tick_labels_cycles = None
+
+        # View mode and canvas size the projection was last set up for
+        self.projection_key = None
+
+        # The vertex buffers are only rebuilt when the traces change
+        self.traces_epoch = 0
+        self.axis_cycles = None
+        self.label_cache = {}
+        self.tick_positions_2D = None
+        self.traces_key = None
+        self.traces_2D = None
+        self.traces_3D = None
+
     def init_gl(self):
         """Configure and initialise the OpenGL context."""
 
+        # State shared by both view modes is only set once per context
+        if self.vbo is None:
+            self.init_gl_static()
+
         if self.dimension == 2:
             self.init_gl_2D()
         else:
             self.init_gl_3D()
 
-    def init_gl_2D(self):
-        """Configure and initialise the 2D OpenGL context."""
-
-        size = self.GetClientSize()
-
-        # User's panning bounds depend on canvas size,
-        # zoom and space signals occupy
-        self.hbound = size.width - self.hspace * self.zoom
-        self.vbound = size.height - self.vspace * self.zoom
-        self.hlbound = -self.hlspace * self.zoom
-        # Ensure positive gap between bounds to prevent 'jiggle' effect
-        # if user zooms too much
+    def init_gl_static(self):
+        """Initialise the OpenGL state that does not change between renders.
 
-        if self.hbound < self.hlbound:
-            self.hbound = self.hlbound
-        if self.vbound < 0:
-            self.vbound = 0
+        This creates the vertex buffer and fonts, and sets up the lights and
+        materials used in 3D view mode.
+        """
 
         self.SetCurrent(self.context)
 
-        GL.glDrawBuffer(GL.GL_BACK)
-        GL.glClearColor(1.0, 1.0, 1.0, 0.0)
-        # Specify dimensions of viewport rectangle
-        GL.glViewport(0, 0, size.width, size.height)
-        GL.glMatrixMode(GL.GL_PROJECTION)
-        GL.glLoadIdentity()
-        # Specify clipping plane coordinates
-        GL.glOrtho(0, size.width, 0, size.height, -1, 1)
-        GL.glMatrixMode(GL.GL_MODELVIEW)
-        GL.glLoadIdentity()
-        GL.glTranslated(self.pan_x, self.pan_y, 0.0)
-        GL.glScaled(self.zoom, self.zoom, self.zoom)
+        # Buffers holding the vertices of the signal traces and 2D axis
+        self.vbo = GL.glGenBuffers(1)
+        self.axis_vbo = GL.glGenBuffers(1)
 
-    def init_gl_3D(self):
-        """Configure and initialise the 3D OpenGL context."""
-        size = self.GetClientSize()
+        # Display lists holding the characters of each font
+        self.font_2D = self.compile_font(GLUT.GLUT_BITMAP_HELVETICA_12)
+        self.font_3D = self.compile_font(GLUT.GLUT_BITMAP_HELVETICA_10)
 
-        self.SetCurrent(self.context)
+        # Display list holding the tick labels of a 2D axis
+        self.tick_labels_2D = GL.glGenLists(1)
 
-        # Specify dimensions of viewport rectangle
-        GL.glViewport(0, 0, size.width, size.height)
-        GL.glMatrixMode(GL.GL_PROJECTION)
-        GL.glLoadIdentity()
-        GLU.gluPerspective(45, size.width / size.height, 10, 10000)
+        # Light positions are given in eye coordinates
         GL.glMatrixMode(GL.GL_MODELVIEW)
         GL.glLoadIdentity()
 
@@ -278,29 +381,109 @@ class MyGLCanvas(wxcanvas.GLCanvas):
                         self.mat_diffuse)
         GL.glColorMaterial(GL.GL_FRONT, GL.GL_AMBIENT_AND_DIFFUSE)
 
-        GL.glClearColor(0.0, 0.0, 0.0, 0.0)
         GL.glDepthFunc(GL.GL_LEQUAL)
         GL.glShadeModel(GL.GL_SMOOTH)
         GL.glDrawBuffer(GL.GL_BACK)
         GL.glCullFace(GL.GL_BACK)
         GL.glEnable(GL.GL_COLOR_MATERIAL)
-        GL.glEnable(GL.GL_CULL_FACE)
-        GL.glEnable(GL.GL_DEPTH_TEST)
-        GL.glEnable(GL.GL_LIGHTING)
         GL.glEnable(GL.GL_LIGHT0)
         GL.glEnable(GL.GL_LIGHT1)
         GL.glEnable(GL.GL_NORMALIZE)
 
-        # Viewing transformation - set the viewpoint back from the scene
-        GL.glTranslatef(0.0, 0.0, -self.depth_offset)
+    def init_gl_2D(self):
+        """Configure and initialise the 2D OpenGL context."""
 
-        # Translate, zoom, and rotate scene objects
-        GL.glTranslatef(self.pan_x_3D, self.pan_y_3D, 0.0)
-        GL.glMultMatrixf(self.scene_rotate)
-        GL.glScalef(self.zoom, self.zoom, self.zoom)
+        size = self.GetClientSize()
+
+        # User's panning bounds depend on canvas size,
+        # zoom and space signals occupy
+        self.hbound = size.width - self.hspace * self.zoom
+        self.vbound = size.height - self.vspace * self.zoom
+        self.hlbound = -self.hlspace * self.zoom
+        # Ensure positive gap between bounds to prevent 'jiggle' effect
+        # if user zooms too much
+
+        if self.hbound < self.hlbound:
+            self.hbound = self.hlbound
+        if self.vbound < 0:
+            self.vbound = 0
+
+        self.SetCurrent(self.context)
+
+        # Lines and text are drawn flat, in the order they are issued
+        GL.glClearColor(1.0, 1.0, 1.0, 0.0)
+        GL.glDisable(GL.GL_CULL_FACE)
+        GL.glDisable(GL.GL_DEPTH_TEST)
+        GL.glDisable(GL.GL_LIGHTING)
+
+        # The projection only changes when the canvas is resized
+        projection_key = (2, size.width, size.height)
+        if self.projection_key != projection_key:
+            self.projection_key = projection_key
+            # Specify dimensions of viewport rectangle
+            GL.glViewport(0, 0, size.width, size.height)
+            GL.glMatrixMode(GL.GL_PROJECTION)
+            GL.glLoadIdentity()
+            # Specify clipping plane coordinates
+            GL.glOrtho(0, size.width, 0, size.height, -1, 1)
+
+        # Pan and zoom the scene
+        GL.glMatrixMode(GL.GL_MODELVIEW)
+        GL.glLoadMatrixf(self.get_modelview_matrix(self.pan_x, self.pan_y))
+
+    def init_gl_3D(self):
+        """Configure and initialise the 3D OpenGL context."""
+        size = self.GetClientSize()
+
+        self.SetCurrent(self.context)
+
+        # The projection only changes when the canvas is resized
+        projection_key = (3, size.width, size.height)
+        if self.projection_key != projection_key:
+            self.projection_key = projection_key
+            # Specify dimensions of viewport rectangle
+            GL.glViewport(0, 0, size.width, size.height)
+            GL.glMatrixMode(GL.GL_PROJECTION)
+            GL.glLoadIdentity()
+            GLU.gluPerspective(45, size.width / size.height, 10, 10000)
+
+        # Lights and materials are set up once in init_gl_static
+        GL.glClearColor(0.0, 0.0, 0.0, 0.0)
+        GL.glEnable(GL.GL_CULL_FACE)
+        GL.glEnable(GL.GL_DEPTH_TEST)
+        GL.glEnable(GL.GL_LIGHTING)
+
+        # Set the viewpoint back from the scene, then translate, zoom and
+        # rotate scene objects
+        GL.glMatrixMode(GL.GL_MODELVIEW)
+        GL.glLoadMatrixf(self.get_modelview_matrix(
+            self.pan_x_3D, self.pan_y_3D, -self.depth_offset,
+            self.scene_rotate))
+
+    def get_modelview_matrix(self, x, y, z=0.0, rotation=None):
+        """Return the modelview matrix of the current view.
+
+        The scene is scaled by the zoom, rotated by rotation if one is given
+        and then translated by (x, y, z). Like scene_rotate, the matrix is
+        laid out in OpenGL's column-major order, so the matrices are
+        multiplied in the reverse of the order OpenGL would apply them.
+        """
+
+        modelview = np.diag(np.array([self.zoom, self.zoom, self.zoom, 1.0],
+                                     dtype=np.float32))
+        if rotation is not None:
+            modelview = modelview @ rotation
+        modelview[3, :3] += (x, y, z)
+        return modelview
 
     def render(self):
-        """Handle all drawing operations."""
+        """Handle all drawing operations.
+
+        Records whether the frame drawn is empty, so that on_paint can skip
+        redrawing it.
+        """
+        self.empty_frame = not self.monitors.monitors_dictionary
+
         self.SetCurrent(self.context)
         if not self.init:
             # Configure the viewport, modelview and projection matrices
@@ -319,12 +502,18 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         self.SwapBuffers()
 
     def on_paint(self, event):
-        """Handle the paint event."""
-        self.SetCurrent(self.context)
-        if not self.init:
-            # Configure the viewport, modelview and projection matrices
-            self.init_gl()
-            self.init = True
+        """Handle the paint event.
+
+        Nothing is drawn while the canvas is hidden, or if no signals are
+        monitored and the canvas already shows an empty frame.
+        """
+        if not self.IsShownOnScreen():
+            return
+
+        if (self.init and self.empty_frame and
+                not self.monitors.monitors_dictionary):
+            return
+
         self.render()
 
     def on_size(self, event):
@@ -352,16 +541,23 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             self.pan_y = 0
 
         self.init = False
+        self.empty_frame = False
         self.Refresh()  # Triggers paint event
 
     def on_mouse(self, event):
-        """Handle mouse events."""
-        self.SetCurrent(self.context)
+        """Handle mouse events.
+
+        The canvas is only repainted if the event changed the view.
+        """
+
+        # View before the event
+        old_view = (self.pan_x, self.pan_y, self.pan_x_3D, self.pan_y_3D,
+                    self.zoom)
+        old_rotate = self.scene_rotate.copy()
 
         if event.ButtonDown():
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = event.GetY()
-            self.init = False
 
         # Restrain pan values within bounds
         if self.pan_x > self.hbound:
@@ -375,8 +571,6 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             self.pan_y = 0
 
         if event.Dragging():
-            GL.glMatrixMode(GL.GL_MODELVIEW)
-            GL.glLoadIdentity()
             x = event.GetX() - self.last_mouse_x
             y = self.last_mouse_y - event.GetY()  # Reverse order to flip axes
 
@@ -408,30 +602,32 @@ class MyGLCanvas(wxcanvas.GLCanvas):
                     self.pan_y = 0
 
             else:  # View is 3D
+                rotation = np.identity(4, 'f')
                 if event.LeftIsDown():
-                    GL.glRotatef(math.sqrt((x * x) + (y * y)), y, x, 0)
+                    # Rotation speed follows the drag distance; the L1
+                    # distance is close enough and needs no square root
+                    rotation = rotation @ self.get_rotation_matrix(
+                        abs(x) + abs(y), y, x, 0)
                 if event.MiddleIsDown():
-                    GL.glRotatef((x + y), 0, 0, 1)
+                    rotation = rotation @ self.get_rotation_matrix(
+                        (x + y), 0, 0, 1)
                 if event.RightIsDown():
                     self.pan_x_3D += x
                     self.pan_y_3D += y
 
-                GL.glMultMatrixf(self.scene_rotate)
-                GL.glGetFloatv(GL.GL_MODELVIEW_MATRIX, self.scene_rotate)
+                # scene_rotate is held in OpenGL's column-major order
+                self.scene_rotate = self.scene_rotate @ rotation.T
 
             self.last_mouse_x = event.GetX()
             self.last_mouse_y = event.GetY()
-            self.init = False
 
         if event.GetWheelRotation() < 0:
             self.zoom *= (1.0 + (
                 event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-            self.init = False
 
         if event.GetWheelRotation() > 0:
             self.zoom /= (1.0 - (
                 event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-            self.init = False
 
         # Bring signal into view on double click
         if event.LeftDClick():
@@ -441,8 +637,49 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             self.pan_y_3D = 0
             self.zoom = 1
 
+        new_view = (self.pan_x, self.pan_y, self.pan_x_3D, self.pan_y_3D,
+                    self.zoom)
+        if (new_view != old_view or
+                not np.array_equal(self.scene_rotate, old_rotate)):
             self.init = False
+            # The view of an empty canvas looks the same wherever it is
+            if self.monitors.monitors_dictionary:
+                self.request_refresh()
+
+    def get_rotation_matrix(self, angle, x, y, z):
+        """Return the matrix rotating by angle degrees about (x, y, z).
+
+        This is the matrix glRotatef would multiply by, computed without a
+        round trip to OpenGL.
+        """
+
+        rotation = np.identity(4, 'f')
+        norm = math.sqrt((x * x) + (y * y) + (z * z))
+        if angle == 0 or norm == 0:
+            return rotation
+
+        x, y, z = x / norm, y / norm, z / norm
+        c = math.cos(math.radians(angle))
+        s = math.sin(math.radians(angle))
+        t = 1 - c
+
+        rotation[:3, :3] = [
+            [x * x * t + c, x * y * t - z * s, x * z * t + y * s],
+            [y * x * t + z * s, y * y * t + c, y * z * t - x * s],
+            [z * x * t - y * s, z * y * t + x * s, z * z * t + c]]
+        return rotation
 
+    def request_refresh(self):
+        """Request a repaint of the canvas.
+
+        Requests arriving in quick succession, such as the motion events of
+        a drag, are coalesced into a single paint event.
+        """
+        if not self.refresh_timer.IsRunning():
+            self.refresh_timer.StartOnce(8)
+
+    def on_refresh_timer(self, event):
+        """Handle the refresh timer event."""
         self.Refresh()  # Triggers the paint event
 
     def get_signal_traces(self):
@@ -452,112 +689,240 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         else:
             self.get_3D_signal_traces()
 
+    def invalidate_traces(self):
+        """Force the traces to be rebuilt on the next render.
+
+        Must be called whenever the monitored signals change.
+        """
+        self.traces_epoch += 1
+        self.empty_frame = False
+
+    def get_signal_label(self, device_id, output_id):
+        """Return the name of the signal to draw beside its trace.
+
+        Names are never changed once they are defined, so each label is
+        only built once.
+        """
+
+        key = (device_id, output_id)
+        text = self.label_cache.get(key)
+        if text is None:
+            text = self.names.get_name_string(device_id)
+
+            # If device has more than one output ...
+            if output_id:
+                text += ("." + self.names.get_name_string(output_id))
+            self.label_cache[key] = text
+        return text
+
     def get_2D_signal_traces(self):
-        """Get the signal traces from the monitors object and display in 2D."""
+        """Get the signal traces from the monitors object and display in 2D.
+
+        The traces are drawn from the vertex buffers, which are only rebuilt
+        when the traces have changed since they were last uploaded.
+        """
 
         # Exit function if no signals are being monitored
         if not self.monitors.monitors_dictionary:
             return
 
+        grey = [0.8, 0.8, 0.8]
         y_pos = 20
 
-        # Plot each signal in monitors_dictionary (holds all monitored signals)
-        for device_id, output_id in self.monitors.monitors_dictionary:
-            signal_list = self.monitors.monitors_dictionary[(device_id,
-                                                             output_id)]
+        # Bind to locals, these are used for every signal
+        get_signal_label = self.get_signal_label
+        render_text_2D = self.render_text_2D
 
-            text = self.names.get_name_string(device_id)
+        # Rebuild the vertex buffers only if the traces have changed
+        traces_key = (self.traces_epoch, 2)
+        if self.traces_key != traces_key:
+            self.traces_key = traces_key
+            self.traces_2D = self.upload_2D_signal_traces()
 
-            # If device has more than one output ...
-            if output_id:
-                text += ("." + self.names.get_name_string(output_id))
-            self.render_text_2D(text, 5, y_pos + 10)  # Display signal name.
+        starts, lengths = self.traces_2D
+
+        # Every axis is drawn from the same buffer, holding an axis as long
+        # as the longest trace
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.axis_vbo)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glVertexPointer(2, GL.GL_FLOAT, 0, None)
+
+        # Label each signal in monitors_dictionary and draw its axis
+        for (device_id, output_id), signal_list in \
+                self.monitors.monitors_dictionary.items():
 
-            # Draw grey axis
-            if len(signal_list) > 0:
-                grey = [0.8, 0.8, 0.8]
+            text = get_signal_label(device_id, output_id)
+            render_text_2D(text, 5, y_pos + 10)  # Display signal name.
+
+            if signal_list:
+                cycles = len(signal_list)
+                GL.glPushMatrix()
+                GL.glTranslatef(0.0, y_pos, 0.0)
+
+                # Draw the first cycles periods of the grey axis
                 GL.glColor3fv(grey)
-                x_next = 0
-                y = 0
-                y_up = 0
-                y_down = 0
-                i = 0
+                GL.glDrawArrays(GL.GL_LINES, 0, (4 * cycles) + 2)
+
+                # Label the ticks below the axis
+                GL.glTranslatef(0.0, -15.0, 0.0)
+                GL.glCallList(self.get_2D_tick_labels(cycles))
+                GL.glPopMatrix()
 
-                for signal in signal_list:
-                    GL.glBegin(GL.GL_LINES)
+            y_pos += 60
 
-                    x = (i * 20) + 30
-                    x_next = (i * 20) + 50
-                    y = y_pos
-                    y_up = y + 5
-                    y_down = y - 5
+        # Draw signals - one line strip per run of non-BLANK signals
+        if starts is not None and len(starts) > 0:
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+            GL.glVertexPointer(2, GL.GL_FLOAT, 0, None)
+            GL.glColor3f(0.0, 0.0, 1.0)
+            GL.glMultiDrawArrays(GL.GL_LINE_STRIP, starts, lengths,
+                                 len(starts))
 
-                    GL.glVertex2f(x, y_up)
-                    GL.glVertex2f(x, y_down)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
-                    GL.glVertex2f(x, y)
-                    GL.glVertex2f(x_next, y)
+    def upload_2D_signal_traces(self):
+        """Upload the vertices of the 2D axis and signals to their buffers.
 
-                    GL.glEnd()
+        The axis buffer is only rebuilt if the longest trace has changed
+        length. Return the start and length of every signal line strip
+        within the signal buffer.
+        """
 
-                    self.render_text_2D(str(i), x-2, y_down - 10, grey)
-                    i += 1
+        traces = list(self.monitors.traces_uint8.values())
 
-                GL.glBegin(GL.GL_LINES)
-                GL.glVertex2f(x_next, y_up)
-                GL.glVertex2f(x_next, y_down)
-                GL.glEnd()
+        # Nothing to upload if no simulation cycles have been run
+        if not any(traces):
+            return (None, None)
 
-                self.render_text_2D(str(i), x_next-2, y_down - 10, grey)
+        max_cycles = max(len(trace) for trace in traces)
+        if self.axis_cycles != max_cycles:
+            self.axis_cycles = max_cycles
+            axis = self.get_2D_axis_vertices(max_cycles)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.axis_vbo)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, axis.nbytes, axis,
+                            GL.GL_STATIC_DRAW)
 
-            # Draw signal
-            GL.glColor3f(0.0, 0.0, 1.0)
-            GL.glBegin(GL.GL_LINE_STRIP)
-            drawing = True
-            i = 0
-
-            for signal in signal_list:
-                if signal != self.devices.BLANK:
-                    if not drawing:
-                        GL.glBegin(GL.GL_LINE_STRIP)
-                        drawing = True
-
-                    if signal == self.devices.HIGH:
-                        x = (i * 20) + 30
-                        x_next = (i * 20) + 50
-                        y = y_pos + 20
-                        y_next = y
-                    elif signal == self.devices.LOW:
-                        x = (i * 20) + 30
-                        x_next = (i * 20) + 50
-                        y = y_pos
-                        y_next = y
-                    elif signal == self.devices.RISING:
-                        x = (i * 20) + 30
-                        x_next = x
-                        y = y_pos
-                        y_next = y_pos + 20
-                    elif signal == self.devices.FALLING:
-                        x = (i * 20) + 30
-                        x_next = x
-                        y = y_pos + 20
-                        y_next = y_pos
-
-                    GL.glVertex2f(x, y)
-                    GL.glVertex2f(x_next, y_next)
+        vertices, starts, lengths = self.get_2D_trace_vertices(traces)
 
-                else:
-                    if drawing:
-                        GL.glEnd()
-                        drawing = False
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
+                        GL.GL_DYNAMIC_DRAW)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
-                i += 1
+        return (starts, lengths)
 
-            GL.glEnd()
-            y_pos += 60
+    def get_2D_tick_positions(self, cycles):
+        """Return the x coordinates of the ticks of an axis of cycles periods.
+
+        The coordinates are shared by the axes, their labels and the signals
+        drawn along them, and are kept until the number of cycles changes.
+        """
+
+        if self.tick_positions_2D is None or \
+                len(self.tick_positions_2D) != cycles + 1:
+            self.tick_positions_2D = (np.arange(cycles + 1, dtype=np.float32)
+                                      * 20 + 30)
+        return self.tick_positions_2D
+
+    def get_2D_tick_labels(self, cycles):
+        """Return the display list labelling the ticks of a 2D axis.
+
+        The labels are drawn on the line y = 0. The display list is only
+        recompiled when the number of cycles changes.
+        """
+
+        if self.tick_labels_cycles != cycles:
+            self.tick_labels_cycles = cycles
+            xs = self.get_2D_tick_positions(cycles)
+            render_text_2D = self.render_text_2D
+            grey = [0.8, 0.8, 0.8]
+
+            GL.glNewList(self.tick_labels_2D, GL.GL_COMPILE)
+            for i, x in enumerate(xs.tolist()):
+                render_text_2D(str(i), x - 2, 0, grey)
+            GL.glEndList()
+
+        return self.tick_labels_2D
+
+    def get_2D_axis_vertices(self, cycles):
+        """Return the GL_LINES vertices of a 2D axis of cycles periods.
+
+        The axis lies on the line y = 0. Each period contributes a tick and
+        a horizontal segment to the next tick, so the first (4 * n) + 2
+        vertices form an axis of n periods, closed by a final tick.
+        """
+
+        xs = self.get_2D_tick_positions(cycles)
+        vertices = np.zeros((cycles + 1, 4, 2), dtype=np.float32)
+
+        # Tick
+        vertices[:, 0, 0] = xs
+        vertices[:, 0, 1] = 5
+        vertices[:, 1, 0] = xs
+        vertices[:, 1, 1] = -5
+
+        # Segment to next tick
+        vertices[:, 2, 0] = xs
+        vertices[:, 3, 0] = xs + 20
+
+        # The final tick has no segment after it
+        return vertices.reshape(-1, 2)[:-2]
+
+    def get_2D_trace_vertices(self, traces):
+        """Return the GL_LINE_STRIP vertices of the signals of every 2D trace.
+
+        The traces are padded with BLANK signals into a single array so that
+        the vertices of all monitors are computed together. Return the
+        vertices, and the start and length (in vertices) of every strip.
+        """
+
+        devices = self.devices
+        num_traces = len(traces)
+        max_cycles = max(len(trace) for trace in traces)
+
+        signals = np.full((num_traces, max_cycles), devices.BLANK,
+                          dtype=np.uint8)
+        for row, trace in zip(signals, traces):
+            row[:len(trace)] = trace
+
+        xs = self.get_2D_tick_positions(max_cycles)
+        y_pos = (np.arange(num_traces, dtype=np.float32) * 60 +
+                 20)[:, np.newaxis]
+
+        high = signals == devices.HIGH
+        low = signals == devices.LOW
+        rising = signals == devices.RISING
+        falling = signals == devices.FALLING
+
+        # Levels run across the period, edges stay on the tick
+        xs = xs[:-1]
+        vertices = np.empty((num_traces, max_cycles, 2, 2), dtype=np.float32)
+        vertices[:, :, 0, 0] = xs
+        vertices[:, :, 0, 1] = np.where(high | falling, y_pos + 20, y_pos)
+        vertices[:, :, 1, 0] = np.where(high | low, xs + 20, xs)
+        vertices[:, :, 1, 1] = np.where(high | rising, y_pos + 20, y_pos)
+
+        drawn = signals != devices.BLANK
+        vertices = vertices[drawn].reshape(-1, 2)
+
+        # Find the runs of consecutive drawn signals. Each row is padded at
+        # both ends so that no run continues onto the next trace.
+        padded = np.zeros((num_traces, max_cycles + 2), dtype=bool)
+        padded[:, 1:-1] = drawn
+        edges = np.flatnonzero(np.diff(padded.ravel()))
+        run_lengths = edges[1::2] - edges[0::2]
+        lengths = (2 * run_lengths).astype(np.int32)
+        starts = (np.cumsum(lengths) - lengths).astype(np.int32)
+
+        return vertices, starts, lengths
 
     def get_3D_signal_traces(self):
-        """Get the signal traces from the monitors object and display in 3D."""
+        """Get the signal traces from the monitors object and display in 3D.
+
+        The traces are drawn from the vertex buffer, which is only rebuilt
+        when the traces have changed since it was last uploaded.
+        """
 
         # Exit function if no signals are being monitored
         if not self.monitors.monitors_dictionary:
@@ -571,142 +936,196 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         # length of one clock period in pixels
         cycle_length = 20
 
-        # Plot each signal in monitors_dictionary (holds all monitored signals)
-        for device_id, output_id in self.monitors.monitors_dictionary:
-            # monitor_name = self.devices.get_signal_name(device_id, output_id)
-            signal_list = self.monitors.monitors_dictionary[(device_id,
-                                                             output_id)]
+        # Bind to locals, these are used for every axis label
+        get_signal_label = self.get_signal_label
+        render_text_3D = self.render_text_3D
+
+        # Label each signal in monitors_dictionary and its axis
+        for (device_id, output_id), signal_list in \
+                self.monitors.monitors_dictionary.items():
+
             cycles = len(signal_list)
             offset = cycle_length * cycles / 2  # Centre of gravity at origin.
-            text = self.names.get_name_string(device_id)
-
-            # If device has more than one output ...
-            if output_id:
-                text += ("." + self.names.get_name_string(output_id))
+            text = get_signal_label(device_id, output_id)
 
             GL.glColor3fv(white)  # Text is white
-            self.render_text_3D(text, x_pos, 12,
-                                -1.5*cycle_length - offset, blue)
+            render_text_3D(text, x_pos, 12, -1.5*cycle_length - offset, blue)
 
-            # Draw axis
+            # show every fifth axis label
             if cycles > 0:
-                GL.glColor3fv(white)  # Axis is white
+                z_first = -offset - cycle_length/2
+                for i in range(0, cycles + 1, 5):
+                    render_text_3D(str(i), x_pos, 1,
+                                   z_first + i * cycle_length, white)
 
-                i = 0
-                z = 0
-                z_pos = 0
-                for signal in signal_list:
-                    z_pos = i * cycle_length - offset
-                    z = z_pos - cycle_length/2
+            x_pos += 60
 
-                    self.draw_cuboid(x_pos+5.5, z, 5.5, 0.2, 1)
-                    self.draw_cuboid(x_pos, z_pos, 0.2, cycle_length/2, 1)
+        # Rebuild the vertex buffer only if the traces have changed
+        traces_key = (self.traces_epoch, 3)
+        if self.traces_key != traces_key:
+            self.traces_key = traces_key
+            self.traces_3D = self.upload_3D_signal_traces()
 
-                    # show every fifth axis label
-                    if i % 5 == 0:
-                        self.render_text_3D(str(i), x_pos, 1, z, white)
+        num_axis_vertices, num_vertices = self.traces_3D
 
-                    i += 1
+        # Nothing to draw if no simulation cycles have been run
+        if not num_axis_vertices:
+            return
 
-                z_pos = i * cycle_length - offset
-                z = z_pos - cycle_length/2
-                self.draw_cuboid(x_pos+5.5, z, 5.5, 0.2, 1)
+        # Positions and normals are interleaved
+        stride = CUBOID_VERTEX.itemsize
+        normal_offset = CUBOID_VERTEX.fields['normal'][1]
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glEnableClientState(GL.GL_NORMAL_ARRAY)
+        GL.glVertexPointer(3, GL.GL_FLOAT, stride, None)
+        GL.glNormalPointer(GL.GL_BYTE, stride, ctypes.c_void_p(normal_offset))
+
+        GL.glColor3fv(white)  # Axis is white
+        GL.glDrawArrays(GL.GL_QUADS, 0, num_axis_vertices)
+        GL.glColor3fv(blue)  # Signal is blue
+        GL.glDrawArrays(GL.GL_QUADS, num_axis_vertices,
+                        num_vertices - num_axis_vertices)
+
+        GL.glDisableClientState(GL.GL_NORMAL_ARRAY)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+    def upload_3D_signal_traces(self):
+        """Upload the vertices of all the 3D traces to the vertex buffer.
+
+        The axis cuboids come first, followed by the signal cuboids. Return
+        the number of axis vertices and the total number of vertices.
+        """
 
-                # show every fifth axis label
-                if i % 5 == 0:
-                    self.render_text_3D(str(i), x_pos, 1, z, white)
+        x_pos = 0
+        cycle_length = 20
+        axis_cuboids = []
+        signal_cuboids = []
 
-                # define starting point for signal
-                x_pos2 = x_pos + cycle_length
+        HIGH = self.devices.HIGH
+        LOW = self.devices.LOW
+        get_cuboid_vertices = self.get_cuboid_vertices
 
-            GL.glColor3fv(blue)  # Signal is blue
-            i = 0
+        for trace in self.monitors.traces_uint8.values():
+            cycles = len(trace)
+            offset = cycle_length * cycles / 2  # Centre of gravity at origin.
 
-            # Draw signal
-            for signal in signal_list:
-                z_pos = i * cycle_length - offset
+            if cycles > 0:
+                # Ticks either side of each clock period and its centre
+                z_ticks = (np.arange(cycles + 1, dtype=np.float32) *
+                           cycle_length - offset - cycle_length/2)
+                z_centres = z_ticks[:-1] + cycle_length/2
+
+                # Axis is made of ticks joined by segments
+                axis_cuboids.append(get_cuboid_vertices(
+                    x_pos+5.5, z_ticks, 5.5, 0.2, 1))
+                axis_cuboids.append(get_cuboid_vertices(
+                    x_pos, z_centres, 0.2, cycle_length/2, 1))
+
+                # Only HIGH and LOW signals are drawn, HIGH ones taller
+                signals = np.array(trace, dtype=np.uint8)
+                heights = np.select([signals == HIGH, signals == LOW], [11, 1])
+                drawn = heights > 0
+
+                # Signal starts one clock period from the axis
+                signal_cuboids.append(get_cuboid_vertices(
+                    x_pos + cycle_length, z_centres[drawn], 5,
+                    cycle_length/2, heights[drawn]))
 
-                if signal == self.devices.HIGH:
-                    self.draw_cuboid(x_pos2, z_pos, 5, cycle_length/2, 11)
+            x_pos += 60
 
-                elif signal == self.devices.LOW:
-                    self.draw_cuboid(x_pos2, z_pos, 5, cycle_length/2, 1)
+        if not axis_cuboids:
+            return (0, 0)
 
-                i += 1
+        axis = np.concatenate(axis_cuboids)
+        vertices = np.concatenate([axis] + signal_cuboids)
 
-            x_pos += 60
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
+                        GL.GL_DYNAMIC_DRAW)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+        return (len(axis), len(vertices))
 
     def render_text_2D(self, text, x_pos, y_pos, colour=[1.0, 1.0, 1.0]):
         """Handle text drawing operations in 2D view."""
 
-        GL.glColor3f(0.0, 0.0, 0.0)  # Text is black
-        GL.glRasterPos2f(x_pos, y_pos)
-        font = GLUT.GLUT_BITMAP_HELVETICA_12
+        glColor3f(0.0, 0.0, 0.0)  # Text is black
+        glListBase(self.font_2D)
 
-        for character in text:
-            if character == '\n':
+        # Draw each line with a single call to the font's display lists
+        if '\n' not in text:
+            glRasterPos2f(x_pos, y_pos)
+            glCallLists(text.encode('latin-1', 'replace'))
+        else:
+            for line in text.split('\n'):
+                glRasterPos2f(x_pos, y_pos)
+                if line:
+                    glCallLists(line.encode('latin-1', 'replace'))
                 y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
 
-        GL.glColor3fv(colour)  # Restore colour used before function call.
+        glColor3fv(colour)  # Restore colour used before function call.
 
     def render_text_3D(self, text, x_pos, y_pos, z_pos, colour):
         """Handle text drawing operations in 3D view."""
-        GL.glDisable(GL.GL_LIGHTING)
-        GL.glRasterPos3f(x_pos, y_pos, z_pos)
-        font = GLUT.GLUT_BITMAP_HELVETICA_10
+        glDisable(GL.GL_LIGHTING)
+        glListBase(self.font_3D)
 
-        for character in text:
-            if character == '\n':
+        # Draw each line with a single call to the font's display lists
+        if '\n' not in text:
+            glRasterPos3f(x_pos, y_pos, z_pos)
+            glCallLists(text.encode('latin-1', 'replace'))
+        else:
+            for line in text.split('\n'):
+                glRasterPos3f(x_pos, y_pos, z_pos)
+                if line:
+                    glCallLists(line.encode('latin-1', 'replace'))
                 y_pos = y_pos - 20
-                GL.glRasterPos3f(x_pos, y_pos, z_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
 
-        GL.glEnable(GL.GL_LIGHTING)
-        GL.glColor3fv(colour)  # Restore pre-function-call colour
+        glEnable(GL.GL_LIGHTING)
+        glColor3fv(colour)  # Restore pre-function-call colour
 
-    def draw_cuboid(self, x_pos, z_pos, half_width, half_depth, height):
-        """Draw a cuboid.
+    def compile_font(self, font):
+        """Compile a display list for each character of a GLUT bitmap font.
 
-        Draw a cuboid at the specified position, with the specified
-        dimensions.
+        Return the name of the first display list. Strings can then be drawn
+        with one glCallLists call instead of one call per character.
         """
 
-        GL.glBegin(GL.GL_QUADS)
-        GL.glNormal3f(0, -1, 0)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos + half_depth)
-        GL.glNormal3f(0, 1, 0)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos + half_depth)
-        GL.glNormal3f(-1, 0, 0)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos + half_depth)
-        GL.glNormal3f(1, 0, 0)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos + half_depth)
-        GL.glNormal3f(0, 0, -1)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos - half_depth)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos - half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos - half_depth)
-        GL.glNormal3f(0, 0, 1)
-        GL.glVertex3f(x_pos - half_width, -6 + height, z_pos + half_depth)
-        GL.glVertex3f(x_pos - half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6, z_pos + half_depth)
-        GL.glVertex3f(x_pos + half_width, -6 + height, z_pos + half_depth)
-        GL.glEnd()
+        base = GL.glGenLists(256)
+        for character in range(256):
+            GL.glNewList(base + character, GL.GL_COMPILE)
+            GLUT.glutBitmapCharacter(font, character)
+            GL.glEndList()
+
+        return base
+
+    def get_cuboid_vertices(self, x_pos, z_pos, half_width, half_depth,
+                            height):
+        """Return the GL_QUADS vertices of cuboids.
+
+        Each argument is either a number or an array with one entry per
+        cuboid. The vertices are laid out as described by CUBOID_VERTEX.
+        """
+
+        x_pos, z_pos, half_width, half_depth, height = np.broadcast_arrays(
+            x_pos, z_pos, half_width, half_depth, height)
+
+        # Scale and translate the unit cuboid into place
+        vertices = np.zeros((len(x_pos), len(UNIT_CUBOID)),
+                            dtype=CUBOID_VERTEX)
+        position = vertices['position']
+        position[:, :, 0] = (x_pos[:, np.newaxis] +
+                             UNIT_CUBOID[:, 0] * half_width[:, np.newaxis])
+        position[:, :, 1] = -6 + UNIT_CUBOID[:, 1] * height[:, np.newaxis]
+        position[:, :, 2] = (z_pos[:, np.newaxis] +
+                             UNIT_CUBOID[:, 2] * half_depth[:, np.newaxis])
+
+        # Byte normals are scaled so that 127 represents 1.0
+        vertices['normal'][:, :, :3] = UNIT_CUBOID[:, 3:] * 127
+
+        return vertices.reshape(-1)
 
 
 class SignalPanel(wx.Panel):
@@ -752,13 +1171,19 @@ class ControlPanel(wx.Panel):
     num_signals_onscreen: holds the number of signals to be displayed
                                                         on the canvas.
 
+    run_text, continue_text, monitoring_text, not_monitoring_text,
+    switch_text, state_word, reset_text, oscillating_text,
+    no_continue_text: translated status messages
+
+    signal_ids: holds the device and output IDs of all signals
     signal_names: holds the names of all signals
+    switch_ids: holds the device IDs of all switches
     switch_names: holds the names of all switches
 
     Public methods
     --------------
-    on_run_button(self, event): starts execution of simulation when run button
-                                                        is pressed.
+    on_run_button(self, event, from_reset): starts execution of simulation
+                                            when run button is pressed.
 
     on_continue_button(self, event): continues execution of simulation
                                         on continue button.
@@ -772,6 +1197,9 @@ class ControlPanel(wx.Panel):
     continue_network(self, cycles): continues running network for specified
                                                     no. of cycles.
 
+    simulate(self, cycles): executes network and records signals for
+                            specified no. of cycles.
+
     on_check_monitor(self, event): triggers monitor or zap command upon
                                                 clicking checkbox.
 
@@ -795,6 +1223,18 @@ class ControlPanel(wx.Panel):
         self.num_signals_onscreen = 0
         self.SetBackgroundColour('#767171')
 
+        # Translate the status messages once, rather than on every event
+        self.run_text = (_("Simulation run for "), _(" cycles."))
+        self.continue_text = (_("Simulation continued for "),
+                              _(" more cycles."))
+        self.monitoring_text = _("Now monitoring ")
+        self.not_monitoring_text = _("No longer monitoring ")
+        self.switch_text = (_("Switch "), _(" has been "))
+        self.state_word = (_("turned off."), _("turned on."))
+        self.reset_text = _("Simulation reset.")
+        self.oscillating_text = _("Error! Network oscillating.")
+        self.no_continue_text = _("Error! Nothing to continue. Run first.")
+
         # Define fonts
         title_font = wx.Font('Helvetica')
         font = wx.Font('Helvetica')
@@ -812,62 +1252,41 @@ class ControlPanel(wx.Panel):
         hbox9 = wx.BoxSizer(wx.HORIZONTAL)
         hbox10 = wx.BoxSizer(wx.HORIZONTAL)
 
-        # Get list of signal names
-        self.signal_names = []
-        for device in self.devices.devices_list:
-            if next(iter(device.outputs)) is None:  # If no output list
-                self.signal_names.append(self.names.
-                                         get_name_string(device.device_id))
-            else:
-                for output_id in device.outputs:
-                    self.signal_names.append(self.names.
-                                             get_name_string(
-                                                device.device_id) + '.' +
-                                             self.names.
-                                             get_name_string(output_id))
-
-        # Get list of names of signals already monitored on startup
-        self.init_monitored = []
-        for (device_id, monitors_id) in self.monitors.monitors_dictionary:
-            signal_name = self.names.get_name_string(device_id)
-            if monitors_id is not None:
-                signal_name = signal_name + '.' + \
-                            self.names.get_name_string(monitors_id)
-            self.init_monitored.append(signal_name)
-
-        # Get indices of all monitored signals in signal_names list
-        index = 0
-        self.index_init_monitored = []
-        for signal in self.signal_names:
-            if signal in self.init_monitored:
-                self.index_init_monitored.append(index)
-            index += 1
+        # Get list of signals and their names
+        get_name_string = self.names.get_name_string
+        self.signal_ids = [
+            (device.device_id, output_id)
+            for device in self.devices.devices_list
+            # A device with no output list has the single output None
+            for output_id in device.outputs]
+        self.signal_names = [
+            get_name_string(device_id) if output_id is None
+            else f"{get_name_string(device_id)}.{get_name_string(output_id)}"
+            for device_id, output_id in self.signal_ids]
+
+        # Get indices in signal_names list of all signals already monitored
+        # on startup
+        signal_index = {signal_id: index
+                        for index, signal_id in enumerate(self.signal_ids)}
+        self.index_init_monitored = sorted(
+            signal_index[signal_id]
+            for signal_id in self.monitors.monitors_dictionary
+            if signal_id in signal_index)
 
         # Change panning range to accommodate monitored signals added onscreen
         self.num_signals_onscreen = len(self.index_init_monitored)
         self.parent.signal_panel.canvas.vspace = 40 * self.num_signals_onscreen
 
-        # Get list of all switch names and all switches already closed
-        # on startup
-        self.switch_names = []
-        self.init_set_switches = []
-        for device in self.devices.devices_list:
-            if device.device_kind == self.devices.SWITCH:
-                self.switch_names.append(self.names.
-                                         get_name_string(device.device_id))
-                if device.switch_state == self.devices.HIGH:
-                    # append name of closed switch to set_switches
-                    self.init_set_switches.append(self.names.
-                                                  get_name_string(device.
-                                                                  device_id))
-
-        # Get indices of all closed switches in set_switches
-        self.index_set_switches = []
-        index = 0
-        for switch in self.switch_names:
-            if switch in self.init_set_switches:
-                self.index_set_switches.append(index)
-            index += 1
+        # Get list of all switch names, and the indices of all switches
+        # already closed on startup
+        switches = [device for device in self.devices.devices_list
+                    if device.device_kind == self.devices.SWITCH]
+        self.switch_ids = [device.device_id for device in switches]
+        self.switch_names = [get_name_string(device_id)
+                             for device_id in self.switch_ids]
+        self.index_set_switches = [
+            index for index, device in enumerate(switches)
+            if device.switch_state == self.devices.HIGH]
 
         # Create widgets
         self.txt_heading = wx.StaticText(self, label=_("CONTROLS"))
@@ -955,31 +1374,35 @@ class ControlPanel(wx.Panel):
         # Set control panel layout
         self.SetSizer(vbox)
 
-    def on_run_button(self, event):
-        """Handle the event when the user clicks the run button."""
+    def on_run_button(self, event, from_reset=False):
+        """Handle the event when the user clicks the run button.
+
+        Also called with from_reset set to redraw the canvas after a reset.
+        """
 
         cycles = self.spin.GetValue()
         # self.cycles_completed += cycles
         self.monitors.reset_monitors()
-        self.devices.cold_startup()
+        self.parent.signal_panel.canvas.invalidate_traces()
 
-        if not self.run_network(cycles):
-            text = _("Error: Could not run network")
-        elif cycles == 0:
+        if cycles == 0:
             # Reset variable to ensure that simulation won't attempt
             # to continue after it has not run at all.
             self.cycles_completed = 0
 
-            # Empty canvas
-            self.parent.signal_panel.canvas.monitors.reset_monitors()
-            self.parent.signal_panel.canvas.render()
+            # Empty canvas without touching its bounds or view
+            self.parent.signal_panel.canvas.request_refresh()
             text = ""
         else:
-            text = _("Simulation run for ") + str(cycles) + _(" cycles.")
+            self.devices.cold_startup()
+            if self.run_network(cycles):
+                run_text, cycles_text = self.run_text
+                text = f"{run_text}{cycles}{cycles_text}"
+            else:
+                text = _("Error: Could not run network")
 
-        # No event when simulation reset
-        if event == _:
-            text = _("Simulation reset.")
+        if from_reset:
+            text = self.reset_text
 
         self.parent.status_bar.set_status(text)
 
@@ -988,12 +1411,15 @@ class ControlPanel(wx.Panel):
 
         cycles = self.spin.GetValue()
         if self.cycles_completed == 0:
-                text = _("Error! Nothing to continue. Run first.")
+                text = self.no_continue_text
+
+        elif self.continue_network(cycles):
+            continue_text, cycles_text = self.continue_text
+            text = f"{continue_text}{cycles}{cycles_text}"
 
         else:
-            self.continue_network(cycles)
-            text = (_("Simulation continued for ") + str(cycles) +
-                    _(" more cycles."))
+            # Leave the oscillation message set by continue_network
+            return
         self.parent.status_bar.set_status(text)
 
     def on_reset_button(self, event):
@@ -1002,39 +1428,31 @@ class ControlPanel(wx.Panel):
         Restore the gui to its initial state.
         """
         self.cycles_completed = 0
-        index = 0
-
-        # Reset monitors dictionary
-        for item in self.signal_names:
-            # Get signal id
-            [self.device_id, self.output_id] = self.devices. \
-                                                    get_signal_ids(item)
 
-            if not self.list_monitor.IsChecked(index):
-                if item in self.init_monitored:
-                    self.monitor_command()
+        # Only the signals and switches whose boxes have changed since
+        # startup need to be reset
+        checked_monitors = set(self.list_monitor.GetCheckedItems())
+        init_monitors = set(self.index_init_monitored)
+        checked_switches = set(self.list_switches.GetCheckedItems())
+        init_switches = set(self.index_set_switches)
 
-            elif self.list_monitor.IsChecked(index):
-                if item not in self.init_monitored:
-                    self.zap_command()
-
-            index += 1
-
-        index = 0
+        # Reset monitors dictionary
+        for index in sorted(checked_monitors ^ init_monitors):
+            self.signal_name = self.signal_names[index]
+            [self.device_id, self.output_id] = self.signal_ids[index]
+            if index in init_monitors:
+                self.monitor_command()
+            else:
+                self.zap_command()
 
         # Reset switches
-        for item in self.switch_names:
-            switch = self.switch_names[index]
-            on = self.list_switches.IsChecked(index)
-            if not(on) and (item in self.init_set_switches):
+        for index in sorted(checked_switches ^ init_switches):
+            if index in init_switches:
                 # Turn switch on
-                switch_id = self.devices.get_signal_ids(switch)[0]
-                self.devices.set_switch(switch_id, 1)
-            elif on and (item not in self.init_set_switches):
+                self.devices.set_switch(self.switch_ids[index], 1)
+            else:
                 # Turn switch off
-                switch_id = self.devices.get_signal_ids(switch)[0]
-                self.devices.set_switch(switch_id, 0)
-            index += 1
+                self.devices.set_switch(self.switch_ids[index], 0)
 
         # Reset widgets
         self.spin.SetValue(10)
@@ -1042,7 +1460,7 @@ class ControlPanel(wx.Panel):
         self.list_switches.SetCheckedItems(self.index_set_switches)
 
         # Reset the canvas
-        self.on_run_button(_)
+        self.on_run_button(None, from_reset=True)
 
     def on_toggle_view(self, event):
         """Handle the event when the user toggles between 2D/3D view."""
@@ -1079,21 +1497,13 @@ class ControlPanel(wx.Panel):
         # Reset number of cycles completed
         self.cycles_completed = cycles
 
-        # Record signals and render.  Otherwise display error message.
-        for _ in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
-                self.parent.signal_panel.canvas.render()
-            else:
-                self.parent.status_bar.set_status(
-                        _("Error! Network oscillating."))
-                return False
-
-        return True
+        return self.simulate(cycles)
 
     def continue_network(self, cycles):
         """Continue the simulation for the specified number of
         simulation cycles.
+
+        Return True if successful.
         """
         # Update number of cycles completed
         self.cycles_completed += cycles
@@ -1101,15 +1511,35 @@ class ControlPanel(wx.Panel):
         # Update canvas bounds
         self.parent.signal_panel.canvas.hlspace = self.cycles_completed * 20
 
-        # Record signals and render.  Otherwise display error message.
-        for _ in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
-                self.parent.signal_panel.canvas.render()
+        return self.simulate(cycles)
+
+    def simulate(self, cycles):
+        """Execute the network and record the monitored signals for the
+        specified number of simulation cycles.
+
+        Return True if successful.
+        """
+        # Bind to locals, these are used every cycle
+        canvas = self.parent.signal_panel.canvas
+        execute_network = self.network.execute_network
+        record_signals = self.monitors.record_signals
+        set_status = self.parent.status_bar.set_status
+
+        # Record signals, then render them all at once.  Otherwise display
+        # error message.
+        success = True
+        for cycle in range(cycles):
+            if execute_network():
+                record_signals()
             else:
-                self.parent.status_bar.set_status(
-                        _("Error! Network oscillating."))
-                return False
+                set_status(self.oscillating_text)
+                success = False
+                break
+
+        # Repaint once the simulation has finished
+        canvas.invalidate_traces()
+        canvas.request_refresh()
+        return success
 
     def on_check_monitor(self, event):
         """Handle the event when a signal is selected to monitor."""
@@ -1120,8 +1550,7 @@ class ControlPanel(wx.Panel):
         self.signal_name = self.signal_names[list_index]
 
         # Get signal id
-        [self.device_id, self.output_id] = self.devices. \
-            get_signal_ids(self.signal_name)
+        [self.device_id, self.output_id] = self.signal_ids[list_index]
 
         # Make monitor if box checked, otherwise remove monitor
         if self.list_monitor.IsChecked(list_index):
@@ -1138,15 +1567,12 @@ class ControlPanel(wx.Panel):
         state = self.list_switches.IsChecked(list_index)
 
         # Status bar message
-        state_word = [_("turned off."), _("turned on.")]
-        text = _("Switch ") + switch + _(" has been ") + state_word[state]
+        switch_text, has_been_text = self.switch_text
+        text = f"{switch_text}{switch}{has_been_text}{self.state_word[state]}"
 
         # Set switch state
-        switch_id = self.devices.get_signal_ids(switch)[0]
+        switch_id = self.switch_ids[list_index]
         self.devices.set_switch(switch_id, state)
-
-        # Update canvas device
-        self.parent.signal_panel.canvas.devices = self.devices
         self.parent.status_bar.set_status(text)
 
     def monitor_command(self):
@@ -1156,30 +1582,26 @@ class ControlPanel(wx.Panel):
                                                    self.output_id,
                                                    self.cycles_completed)
         if monitor_error == self.monitors.NO_ERROR:
-            self.parent.status_bar.set_status(_("Now monitoring ") +
-                                              self.signal_name)
+            self.parent.status_bar.set_status(
+                f"{self.monitoring_text}{self.signal_name}")
             print(_("Successfully made monitor."))
             self.num_signals_onscreen += 1
+            self.parent.signal_panel.canvas.invalidate_traces()
         else:
             print(_("Error! Could not make monitor."))
 
-        # Update canvas monitors
-        self.parent.signal_panel.canvas.monitors = self.monitors
-
     def zap_command(self):
         """Remove the specified monitor."""
 
         if self.monitors.remove_monitor(self.device_id, self.output_id):
-            self.parent.status_bar.set_status(_("No longer monitoring ") +
-                                              self.signal_name)
+            self.parent.status_bar.set_status(
+                f"{self.not_monitoring_text}{self.signal_name}")
             print(_("Successfully zapped monitor."))
             self.num_signals_onscreen -= 1
+            self.parent.signal_panel.canvas.invalidate_traces()
         else:
             print(_("Error! Could not zap monitor."))
 
-        # Update canvas monitors
-        self.parent.signal_panel.canvas.monitors = self.monitors
-
 
 class Tab(wx.Panel):
     """Create a tab for the main window."""
@@ -8,6 +8,7 @@ Classes
 Monitors - records and displays specified output signals.
 
 """
+import array
 import collections
 
 
@@ -57,6 +58,10 @@ class Monitors:
         # {(device_id, output_id): [signal_list]}
         self.monitors_dictionary = collections.OrderedDict()
 
+        # traces_uint8 mirrors monitors_dictionary, storing one byte per
+        # signal so that the traces can be copied into arrays in one pass
+        self.traces_uint8 = collections.OrderedDict()
+
         [self.NO_ERROR, self.NOT_OUTPUT,
          self.MONITOR_PRESENT] = self.names.unique_error_codes(3)
 
@@ -79,6 +84,8 @@ class Monitors:
             # list.
             self.monitors_dictionary[(device_id, output_id)] = [
                 self.devices.BLANK] * cycles_completed
+            self.traces_uint8[(device_id, output_id)] = array.array(
+                'B', [self.devices.BLANK] * cycles_completed)
             return self.NO_ERROR
 
     def remove_monitor(self, device_id, output_id):
@@ -90,6 +97,7 @@ class Monitors:
             return False
         else:
             del self.monitors_dictionary[(device_id, output_id)]
+            del self.traces_uint8[(device_id, output_id)]
             return True
 
     def get_monitor_signal(self, device_id, output_id):
@@ -111,6 +119,9 @@ class Monitors:
             signal_level = self.get_monitor_signal(device_id, output_id)
             self.monitors_dictionary[(device_id,
                                       output_id)].append(signal_level)
+            if signal_level is None:  # Signal is undefined
+                signal_level = self.devices.BLANK
+            self.traces_uint8[(device_id, output_id)].append(signal_level)
 
     def get_signal_names(self):
         """Return two signal name lists: monitored and not monitored."""
@@ -137,6 +148,7 @@ class Monitors:
         """
         for device_id, output_id in self.monitors_dictionary:
             self.monitors_dictionary[(device_id, output_id)] = []
+            self.traces_uint8[(device_id, output_id)] = array.array('B')
 
     def get_margin(self):
         """Return the length of the longest monitor's name.
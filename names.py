@@ -33,6 +33,8 @@ class Names:
 
     lookup(self, name_string_list): Returns a list of name IDs for each
                         name string. Adds a name if not already present.
+    lookup_one(self, name_string): Returns the name ID for a single name
+                        string. Adds the name if not already present.
 
     get_name_string(self, name_id): Returns the corresponding name string for
                         the name ID. Returns None if the ID is not present.
@@ -41,6 +43,7 @@ class Names:
     def __init__(self):
         # Initialise the names list
         self.nametable = []
+        self.name_ids = {}  # name ID of each string in nametable
         self.error_code_count = 0  # how many error codes have been declared
 
     def unique_error_codes(self, num_error_codes):
@@ -55,24 +58,25 @@ class Names:
         """Return the corresponding name ID for name_string.
         If the name string is not present in the names list, return None.
         """
-        if name_string in self.nametable:
-            return self.nametable.index(name_string)
-        else:
-            return
+        return self.name_ids.get(name_string)
 
     def lookup(self, name_string_list):
         """Return a list of name IDs for each name string in name_string_list.
         If the name string is not present in the names list, add it.
         """
-        list = []
-        for i in range(0, len(name_string_list)):
-            if name_string_list[i] in self.nametable:
-                index_num = self.nametable.index(name_string_list[i])
-                list.append(index_num)
-            else:
-                self.nametable.append(name_string_list[i])
-                list.append(self.nametable.index(name_string_list[i]))
-        return list
+        return [self.lookup_one(name_string)
+                for name_string in name_string_list]
+
+    def lookup_one(self, name_string):
+        """Return the name ID for a single name string.
+        If the name string is not present in the names list, add it.
+        """
+        name_id = self.name_ids.get(name_string)
+        if name_id is None:
+            name_id = len(self.nametable)
+            self.nametable.append(name_string)
+            self.name_ids[name_string] = name_id
+        return name_id
 
     def get_name_string(self, name_id):
         """Return the corresponding name string for the given name_id.
@@ -55,11 +55,8 @@ class Parser:
 
     check_keyword(self, keyword): Checks to see if keyword is present.
 
-    build_list(self, expected_type, method): Build up list using the
-                                             method provided.
-
-    check_syntax(self, expected_type, method): Check the syntax for the
-                                               current list.
+    parse_list(self, expected_type, method): Parse the items of the current
+                                             list using the method provided.
 
     check_end(self, error_recovery=True): Checks to see if END is present.
 
@@ -72,7 +69,8 @@ class Parser:
 
     get_io(self, io): Retrieves corresponding port ID for current symbol.
                       io is either self.OUTPUT or self.INPUT.
-                      Returns (device_id, port_id).
+                      Returns (device_id, port_id), or None if the
+                      symbols do not give a valid port.
 
     check_io(self, io): Check syntax for io.
 
@@ -80,6 +78,10 @@ class Parser:
                                                           the parser has
                                                           encountered.
 
+    format_error(self, error_type, vararg, resumed_linenum): Return the
+                                                             message for
+                                                             an error.
+
     error_report(self): Build and display the error report.
     """
 
@@ -98,6 +100,9 @@ class Parser:
         self.missing_end = False
         self.reached_eof = False
 
+        # The scanner tokenizes the whole file on the first call
+        self.get_symbol = scanner.get_symbol
+
         [self.SYNTAX_COLON, self.KEYWORD_ERROR,
          self.SYMBOL_TYPE_ERROR, self.NO_DEVICE,
          self.BAD_NAME, self.NOT_VALID_NAME,
@@ -117,26 +122,140 @@ class Parser:
                                                   "SEMI COLON", "ARROW (->)",
                                                   "PERIOD (.)"]
 
+        # Copy the scanner and devices constants used while parsing, so
+        # that each use is a single attribute lookup
+        [self.NAMES_TYPE, self.PROPERTY_TYPE, self.NUMBER_TYPE,
+         self.SCL_TYPE, self.AR_TYPE, self.PE_TYPE, self.CL_TYPE,
+         self.KEYWORDS_TYPE,
+         self.DEVICETYPE_TYPE] = [scanner.NAMES, scanner.PROPERTY,
+                                  scanner.NUMBER, scanner.SCL, scanner.AR,
+                                  scanner.PE, scanner.CL, scanner.KEYWORDS,
+                                  scanner.DEVICETYPE]
+        [self.DEVICE_LIST, self.CONNECTION_LIST,
+         self.MONITOR_LIST] = [scanner.DEVICE_LIST, scanner.CONNECTION_LIST,
+                               scanner.MONITOR_LIST]
+        [self.END, self.EOF, self.SEMI_COLON, self.ARROW,
+         self.PERIOD] = [scanner.END, scanner.EOF, scanner.SEMI_COLON,
+                         scanner.ARROW, scanner.PERIOD]
+        [self.D_TYPE, self.SWITCH, self.SIGGEN] = [devices.D_TYPE,
+                                                   devices.SWITCH,
+                                                   devices.SIGGEN]
+        self.device_keywords = scanner.device_keywords_set
+
+        # Switch state for each (device kind, initial state) pair
+        self.switch_states = {
+            (devices.SWITCH, scanner.OFF): devices.LOW,
+            (devices.SWITCH, scanner.ON): devices.HIGH}
+
+        # Message and stopping symbols for error recovery for each error
+        # type.  EOF always stops error recovery.
+        self.stop_at_eof = frozenset([self.EOF])
+        skip_item = self.stop_at_eof | {self.SEMI_COLON, self.END}
+        skip_list = self.stop_at_eof | {self.END}
+        self.error_table = {
+            self.NO_EOF: ("End of file not reached.", self.stop_at_eof),
+            self.KEYWORD_ERROR: ("List declaration not made. Expected '{}'. "
+                                 "Advancing to next list.", skip_list),
+            self.SYNTAX_COLON: ("Expected a ':' after a list declaration. "
+                                "Advancing to next list.", skip_list),
+            self.SYMBOL_TYPE_ERROR: ("Expected a {}.", skip_item),
+            self.NO_DEVICE: ("This does not match a known device.",
+                             skip_item),
+            self.BAD_NAME: ("Expected a name for the device. Make sure it is "
+                            "not one of the reserved keywords and follows "
+                            "the correct syntax.", skip_item),
+            self.NOT_VALID_NAME: ("Already used as a name for another "
+                                  "device.", skip_item),
+            self.SYNTAX: ("Expected a '{}'.", skip_item),
+            self.END_ERROR: ("Expected either another item in list or the "
+                             "keyword END.",
+                             self.stop_at_eof |
+                             self.scanner.keywords_set),
+            self.IDENTIFIER_PRESENT: ("Not expecting an identifier.",
+                                      skip_item),
+            self.NO_IDENTIFIER: ("No identifier present.", skip_item),
+            self.UNCONNECTED_INPUTS: ("Not all inputs are connected.",
+                                      self.stop_at_eof),
+            self.NO_MONITOR: ("No monitor points chosen. At least one "
+                              "output must be monitored.", self.stop_at_eof),
+
+            # Errors defined in Monitors
+            self.monitors.NOT_OUTPUT: ("This point cannot be monitored as "
+                                       "it is not an output.", skip_item),
+            self.monitors.MONITOR_PRESENT: ("This point is already being "
+                                            "monitored.", skip_item),
+
+            # Errors defined in Network
+            self.network.INPUT_TO_INPUT: ("Cannot connect an input to an "
+                                          "input.", skip_item),
+            self.network.OUTPUT_TO_OUTPUT: ("Cannot connect an output to an "
+                                            "output.", skip_item),
+            self.network.INPUT_CONNECTED: ("The input is already connected "
+                                           "elsewhere.", skip_item),
+            self.network.PORT_ABSENT: ("One of the ports does not exist.",
+                                       skip_item),
+            self.network.DEVICE_ABSENT: ("One of the devices does not exist "
+                                         "in network.", skip_item),
+
+            # Errors defined in Devices
+            self.devices.INVALID_QUALIFIER: ("Property not recognised for "
+                                             "device.{}", skip_item),
+            self.devices.NO_QUALIFIER: ("Expected a property for the "
+                                        "device.", skip_item),
+            self.devices.BAD_DEVICE: ("Something went wrong adding this "
+                                      "device to the network.", skip_item),
+            self.devices.QUALIFIER_PRESENT: ("Property not required for this "
+                                             "device.", skip_item),
+            self.devices.DEVICE_PRESENT: ("This device already exists.",
+                                          skip_item)}
+
+        # Hints on the expected property for each device kind
+        gate_hint = (" Make sure property is an integer less than 17 "
+                     "(and greater than 0).")
+        self.property_hints = {gate: gate_hint
+                               for gate in self.devices.gate_types
+                               if gate != self.devices.XOR}
+        self.property_hints.update({
+            self.devices.SWITCH: " Make sure property is either 'OFF' or "
+                                 "'ON'.",
+            self.devices.CLOCK: " Make sure property is a positive integer.",
+            self.devices.SIGGEN: " Make sure property contains only '0's "
+                                 "and '1's."})
+
+        # Text to fill into the message of errors that depend on vararg
+        get_name_string = self.names.get_name_string
+        self.error_arguments = {
+            self.KEYWORD_ERROR: get_name_string,
+            self.SYMBOL_TYPE_ERROR: str,
+            self.SYNTAX: get_name_string,
+            self.devices.INVALID_QUALIFIER: lambda kind: (
+                self.property_hints.get(kind, ""))}
+
     def parse_network(self):
         """Parse the circuit definition file."""
 
-        self.symbol = self.scanner.get_symbol()
-
-        # Start parsing file. First declaration must be a device list
-        if not self.devicelist():
-            print("Errors encountered in device list. "
-                  "Will now check for syntax errors in rest of file.")
-            self.connectionlist(False)
-            self.monitorlist(False)
-        else:
-            if not self.connectionlist():
-                print("Errors encountered in connection list. "
-                      "Will now check for syntax errors in monitor list.")
-                self.monitorlist(False)
-            else:
-                self.monitorlist()
-
-        if (self.symbol.id == self.scanner.EOF and
+        self.symbol = self.get_symbol()
+
+        # Parse each list in turn, with the message to print if it has
+        # errors.  First declaration must be a device list.
+        lists = ((self.devicelist,
+                  "Errors encountered in device list. "
+                  "Will now check for syntax errors in rest of file."),
+                 (self.connectionlist,
+                  "Errors encountered in connection list. "
+                  "Will now check for syntax errors in monitor list."),
+                 (self.monitorlist, None))
+
+        # Once a list has errors, only check the syntax of the rest
+        semantic_checks = True
+        for list_parser, error_message in lists:
+            if not semantic_checks:
+                list_parser(False)
+            elif not list_parser() and error_message is not None:
+                print(error_message)
+                semantic_checks = False
+
+        if (self.symbol.id == self.EOF and
                 not self.error_count):
             print("Parsing complete.")
             return True
@@ -159,11 +278,11 @@ class Parser:
         print("Parsing device list...")
 
         # First symbol expected is "DEVICE_LIST"
-        if not self.check_keyword(self.scanner.DEVICE_LIST):
+        if not self.check_keyword(self.DEVICE_LIST):
             return False
 
         # Build list
-        if not self.build_list(self.scanner.DEVICETYPE, self.device):
+        if not self.parse_list(self.DEVICETYPE_TYPE, self.device):
             if not self.missing_end:
                 self.check_end()
             else:
@@ -184,19 +303,19 @@ class Parser:
         print("Parsing connection list...")
 
         # Symbol expected is "CONNECTION_LIST"
-        if not self.check_keyword(self.scanner.CONNECTION_LIST):
+        if not self.check_keyword(self.CONNECTION_LIST):
             return False
 
         # Build list
         if semantic_checks:
-            if not self.build_list(self.scanner.NAMES, self.connect):
+            if not self.parse_list(self.NAMES_TYPE, self.connect):
                 if not self.missing_end:
                     self.check_end()
                 else:
                     self.missing_end = False
                 return False
         else:
-            self.check_syntax(self.scanner.NAMES, self.connect_syntax)
+            self.parse_list(self.NAMES_TYPE, self.connect_syntax)
             if self.missing_end:
                 self.missing_end = False
                 return
@@ -220,22 +339,22 @@ class Parser:
         print("Parsing monitor list...")
 
         # Symbol expected is "MONITOR_LIST"
-        if not self.check_keyword(self.scanner.MONITOR_LIST):
+        if not self.check_keyword(self.MONITOR_LIST):
             return
 
         # Build list
         if semantic_checks:
-            self.build_list(self.scanner.NAMES, self.monitor)
+            self.parse_list(self.NAMES_TYPE, self.monitor)
             if not self.monitors.monitors_dictionary:
                 self.error(self.NO_MONITOR, False)
         else:
-            self.check_syntax(self.scanner.NAMES, self.monitor_syntax)
+            self.parse_list(self.NAMES_TYPE, self.monitor_syntax)
 
         # Expect the "END" keyword
         self.check_end(False)
 
         # Expect EOF
-        if self.symbol.id != self.scanner.EOF:
+        if self.symbol.id != self.EOF:
             self.error(self.NO_EOF, False)
 
     def device(self):
@@ -243,14 +362,14 @@ class Parser:
 
         # Check to see if device type is valid
         type = self.symbol.id
-        if type not in self.scanner.device_keywords:
+        if type not in self.device_keywords:
             self.error(self.NO_DEVICE, True)
             return False
 
-        self.symbol = self.scanner.get_symbol()
+        self.symbol = self.get_symbol()
 
         # Expecting a name
-        if self.symbol.type == self.scanner.NAMES:
+        if self.symbol.type == self.NAMES_TYPE:
             id = self.symbol.id
 
             # Check to see if name is valid
@@ -259,13 +378,13 @@ class Parser:
                 return False
 
             property = None
-            self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
 
             # Not all devices require PROPERTY
-            if (self.symbol.type == self.scanner.PROPERTY or
-                    self.symbol.type == self.scanner.NUMBER):
+            if (self.symbol.type == self.PROPERTY_TYPE or
+                    self.symbol.type == self.NUMBER_TYPE):
                 property = self.get_property(type)
-                self.symbol = self.scanner.get_symbol()
+                self.symbol = self.get_symbol()
 
             # Make device
             error_type = self.devices.make_device(id,
@@ -276,10 +395,10 @@ class Parser:
                 self.error(error_type, True, type)
                 return False
 
-            if self.symbol.type == self.scanner.SCL:
-                self.symbol = self.scanner.get_symbol()
+            if self.symbol.type == self.SCL_TYPE:
+                self.symbol = self.get_symbol()
             else:
-                self.error(self.SYNTAX, True, self.scanner.SEMI_COLON)
+                self.error(self.SYNTAX, True, self.SEMI_COLON)
                 return False
         else:
             self.error(self.BAD_NAME, True)
@@ -291,18 +410,20 @@ class Parser:
         """Parse through connection details, and make connection."""
 
         # Expecting output
-        output_id, output_port_id = self.get_io(self.OUTPUT)
-        if (output_id, output_port_id) == (None, None):
+        output = self.get_io(self.OUTPUT)
+        if output is None:
             return False
+        output_id, output_port_id = output
 
-        if self.symbol.type == self.scanner.AR:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == self.AR_TYPE:
+            self.symbol = self.get_symbol()
 
             # Expecting input
-            if self.symbol.type == self.scanner.NAMES:
-                input_id, input_port_id = self.get_io(self.INPUT)
-                if (input_id, input_port_id) == (None, None):
+            if self.symbol.type == self.NAMES_TYPE:
+                input = self.get_io(self.INPUT)
+                if input is None:
                     return False
+                input_id, input_port_id = input
 
                 # Make connection
                 error_type = self.network.make_connection(input_id,
@@ -313,16 +434,16 @@ class Parser:
                     self.error(error_type, True)
                     return False
 
-                if self.symbol.type == self.scanner.SCL:
-                    self.symbol = self.scanner.get_symbol()
+                if self.symbol.type == self.SCL_TYPE:
+                    self.symbol = self.get_symbol()
                 else:
-                    self.error(self.SYNTAX, True, self.scanner.SEMI_COLON)
+                    self.error(self.SYNTAX, True, self.SEMI_COLON)
                     return False
             else:
                 self.error(self.SYMBOL_TYPE_ERROR, True, self.NAMES)
                 return False
         else:
-            self.error(self.SYNTAX, True, self.scanner.ARROW)
+            self.error(self.SYNTAX, True, self.ARROW)
             return False
 
         return True
@@ -334,30 +455,31 @@ class Parser:
         if not self.check_io(self.OUTPUT):
             return
 
-        if self.symbol.type == self.scanner.AR:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == self.AR_TYPE:
+            self.symbol = self.get_symbol()
 
             # Expecting input
-            if self.symbol.type == self.scanner.NAMES:
+            if self.symbol.type == self.NAMES_TYPE:
                 if not self.check_io(self.INPUT):
                     return
 
-                if self.symbol.type == self.scanner.SCL:
-                    self.symbol = self.scanner.get_symbol()
+                if self.symbol.type == self.SCL_TYPE:
+                    self.symbol = self.get_symbol()
                 else:
-                    self.error(self.SYNTAX, True, self.scanner.SEMI_COLON)
+                    self.error(self.SYNTAX, True, self.SEMI_COLON)
             else:
                 self.error(self.SYMBOL_TYPE_ERROR, True, self.NAMES)
         else:
-            self.error(self.SYNTAX, True, self.scanner.ARROW)
+            self.error(self.SYNTAX, True, self.ARROW)
 
     def monitor(self):
         """Parse through outputs to monitor, making monitor points."""
 
         # Expecting output
-        output_id, output_port_id = self.get_io(self.OUTPUT)
-        if (output_id, output_port_id) == (None, None):
+        output = self.get_io(self.OUTPUT)
+        if output is None:
             return
+        output_id, output_port_id = output
 
         # Make monitor
         error_type = self.monitors.make_monitor(output_id, output_port_id)
@@ -365,10 +487,10 @@ class Parser:
             self.error(error_type, True)
             return
 
-        if self.symbol.type == self.scanner.SCL:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == self.SCL_TYPE:
+            self.symbol = self.get_symbol()
         else:
-            self.error(self.SYNTAX, True, self.scanner.SEMI_COLON)
+            self.error(self.SYNTAX, True, self.SEMI_COLON)
 
     def monitor_syntax(self):
         """Parse through outputs to monitor, checking syntax."""
@@ -377,18 +499,18 @@ class Parser:
         if not self.check_io(self.OUTPUT):
             return
 
-        if self.symbol.type == self.scanner.SCL:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.type == self.SCL_TYPE:
+            self.symbol = self.get_symbol()
         else:
-            self.error(self.SYNTAX, True, self.scanner.SEMI_COLON)
+            self.error(self.SYNTAX, True, self.SEMI_COLON)
 
     def check_keyword(self, keyword):
         """Checks to see if keyword is present."""
 
         if self.symbol.id == keyword:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.CL:
-                self.symbol = self.scanner.get_symbol()
+            self.symbol = self.get_symbol()
+            if self.symbol.type == self.CL_TYPE:
+                self.symbol = self.get_symbol()
                 return True
             else:
                 self.error(self.SYNTAX_COLON, True)
@@ -397,62 +519,56 @@ class Parser:
 
         return False
 
-    def build_list(self, expected_type, method):
-        """Build up list using the method provided."""
+    def parse_list(self, expected_type, method):
+        """Parse the items of the current list using the method provided.
+
+        Return True if every item was parsed successfully.
+        """
+
+        # Bind to locals, these are used for every symbol in the list
+        end = self.END
+        eof = self.EOF
+        keywords = self.KEYWORDS_TYPE
+        colon = self.CL_TYPE
+        error = self.error
 
         success = True
 
-        while (self.symbol.id != self.scanner.END and
-                self.symbol.id != self.scanner.EOF):
+        while True:
+            symbol = self.symbol
+            if symbol.id == end or symbol.id == eof:
+                break
 
-            if self.symbol.type == expected_type:
+            if symbol.type == expected_type:
                 if not method():
                     success = False
-            elif (self.symbol.type == self.scanner.KEYWORDS or
-                    self.symbol.type == self.scanner.CL):
-                self.error(self.END_ERROR, False)
+            elif symbol.type == keywords or symbol.type == colon:
+                error(self.END_ERROR, False)
                 success = False
                 self.missing_end = True
                 break
             else:
-                self.error(self.SYMBOL_TYPE_ERROR, True,
-                           self.symbol_types[expected_type])
+                error(self.SYMBOL_TYPE_ERROR, True,
+                      self.symbol_types[expected_type])
                 success = False
 
         return success
 
-    def check_syntax(self, expected_type, method):
-        """Check the syntax for the current list."""
-
-        while (self.symbol.id != self.scanner.END and
-                self.symbol.id != self.scanner.EOF):
-            if self.symbol.type == expected_type:
-                method()
-            elif (self.symbol.type == self.scanner.KEYWORDS or
-                    self.symbol.type == self.scanner.CL):
-                self.error(self.END_ERROR, False)
-                self.missing_end = True
-                break
-            else:
-                self.error(self.SYMBOL_TYPE_ERROR, True,
-                           self.symbol_types[expected_type])
-
     def check_end(self, error_recovery=True):
         """Checks to see if END is present."""
 
         # Expect the "END" keyword
-        if self.symbol.id == self.scanner.END:
-            self.symbol = self.scanner.get_symbol()
+        if self.symbol.id == self.END:
+            self.symbol = self.get_symbol()
         else:
-            self.error(self.END_ERROR, error_recovery)
+            # Nothing to recover past once the end of file is reached
+            self.error(self.END_ERROR,
+                       error_recovery and not self.reached_eof)
 
     def check_valid_name(self, id):
         """Checks to see if name is valid."""
 
-        if not self.devices.get_device(id):
-            return True
-
-        return False
+        return id not in self.devices.devices_by_id
 
     def get_property(self, type):
         """Check that the current symbol is a valid property.
@@ -463,18 +579,16 @@ class Parser:
 
         property = self.symbol.id
 
-        # Check if device is switch
-        if (type == self.devices.SWITCH and
-                property in self.scanner.initial_states):
-            if property == self.scanner.OFF:
-                return self.devices.LOW
-            return self.devices.HIGH
+        # Check if device is switch with a valid initial state
+        state = self.switch_states.get((type, property))
+        if state is not None:
+            return state
 
-        elif self.symbol.type == self.scanner.NUMBER:
+        if self.symbol.type == self.NUMBER_TYPE:
             prop = self.names.get_name_string(property)
             # If device is siggen, keep property as str,
             # otherwise cast it into an int
-            if type == self.devices.SIGGEN:
+            if type == self.SIGGEN:
                 property = prop
             else:
                 property = int(prop)
@@ -486,49 +600,50 @@ class Parser:
         """Retrieves corresponding port ID for current symbol.
 
         io is either self.OUTPUT or self.INPUT.
-        Returns (device_id, port_id).
+        Returns (device_id, port_id), or None if the symbols do not give
+        a valid port.
         """
 
         id = self.symbol.id
-        device = self.devices.get_device(id)
+        device = self.devices.devices_by_id.get(id)
         if device is None:
             self.error(self.NO_DEVICE, True)
-            return (None, None)
+            return None
 
         port = None
 
         # Inputs must have identifiers; outputs don't, unless D_TYPE device
         expect_identifier = (io == self.INPUT or
-                             device.device_kind == self.devices.D_TYPE)
-        self.symbol = self.scanner.get_symbol()
-        if self.symbol.type == self.scanner.PE:
+                             device.device_kind == self.D_TYPE)
+        self.symbol = self.get_symbol()
+        if self.symbol.type == self.PE_TYPE:
             if expect_identifier:
-                self.symbol = self.scanner.get_symbol()
-                if self.symbol.type == self.scanner.NAMES:
+                self.symbol = self.get_symbol()
+                if self.symbol.type == self.NAMES_TYPE:
                     port = self.symbol.id
-                    self.symbol = self.scanner.get_symbol()
+                    self.symbol = self.get_symbol()
                 else:
                     self.error(self.NO_IDENTIFIER, True)
-                    return (None, None)
+                    return None
             else:
                 self.error(self.IDENTIFIER_PRESENT, True)
-                return (None, None)
+                return None
 
         # Identifier expected but period symbol not found
         elif expect_identifier:
-            self.error(self.SYNTAX, True, self.scanner.PERIOD)
-            return (None, None)
+            self.error(self.SYNTAX, True, self.PERIOD)
+            return None
 
         return (id, port)
 
     def check_io(self, io):
         """Check syntax for io."""
 
-        self.symbol = self.scanner.get_symbol()
-        if self.symbol.type == self.scanner.PE:
-            self.symbol = self.scanner.get_symbol()
-            if self.symbol.type == self.scanner.NAMES:
-                self.symbol = self.scanner.get_symbol()
+        self.symbol = self.get_symbol()
+        if self.symbol.type == self.PE_TYPE:
+            self.symbol = self.get_symbol()
+            if self.symbol.type == self.NAMES_TYPE:
+                self.symbol = self.get_symbol()
             else:
                 self.error(self.NO_IDENTIFIER, True)
                 return False
@@ -539,159 +654,48 @@ class Parser:
         """Handle the error the parser has encountered."""
 
         self.error_count += 1
-        error_message = "***Error: "
-        stopping_symbol = [self.scanner.EOF]
+        stopping_symbol = self.error_table.get(
+            error_type, ("", self.stop_at_eof))[1]
+        resumed_linenum = None
         stop = None
 
-        if error_type == self.NO_EOF:
-            error_message += "End of file not reached."
-
-        elif error_type == self.KEYWORD_ERROR:
-            key = self.names.get_name_string(vararg)
-            error_message += ("List declaration not made. Expected '" +
-                              key + "'. "
-                              "Advancing to next list.")
-            stopping_symbol.append(self.scanner.END)
-        elif error_type == self.SYNTAX_COLON:
-            error_message += ("Expected a ':' "
-                              "after a list declaration. "
-                              "Advancing to next list.")
-            stopping_symbol.append(self.scanner.END)
-        elif error_type == self.SYMBOL_TYPE_ERROR:
-            type = vararg
-            error_message += "Expected a " + type + "."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.NO_DEVICE:
-            error_message += "This does not match a known device."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.BAD_NAME:
-            error_message += ("Expected a name for the device. "
-                              "Make sure it is not one of the "
-                              "reserved keywords and follows "
-                              "the correct syntax.")
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.NOT_VALID_NAME:
-            error_message += "Already used as a name for another device."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.SYNTAX:
-            syn = self.names.get_name_string(vararg)
-            error_message += "Expected a '" + syn + "'."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.END_ERROR:
-            error_message += ("Expected either another item in list "
-                              "or the keyword END.")
-            stopping_symbol.extend(self.scanner.keywords_list)
-        elif error_type == self.IDENTIFIER_PRESENT:
-            error_message += "Not expecting an identifier."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.NO_IDENTIFIER:
-            error_message += "No identifier present."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.UNCONNECTED_INPUTS:
-            error_message += "Not all inputs are connected."
-        elif error_type == self.NO_MONITOR:
-            error_message += ("No monitor points chosen. "
-                              "At least one output must be monitored.")
-
-        # Errors defined in Monitors
-        elif error_type == self.monitors.NOT_OUTPUT:
-            error_message += ("This point cannot be monitored "
-                              "as it is not an output.")
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.monitors.MONITOR_PRESENT:
-            error_message += "This point is already being monitored."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-
-        # Errors defined in Network
-        elif error_type == self.network.INPUT_TO_INPUT:
-            error_message += "Cannot connect an input to an input."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.network.OUTPUT_TO_OUTPUT:
-            error_message += "Cannot connect an output to an output."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.network.INPUT_CONNECTED:
-            error_message += "The input is already connected elsewhere."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.network.PORT_ABSENT:
-            error_message += "One of the ports does not exist."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.network.DEVICE_ABSENT:
-            error_message += "One of the devices does not exist in network."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-
-        # Errors defined in Devices
-        elif error_type == self.devices.INVALID_QUALIFIER:
-            error_message += "Property not recognised for device."
-            if vararg == self.devices.SWITCH:
-                error_message += (" Make sure property is "
-                                  "either 'OFF' or 'ON'.")
-            elif vararg == self.devices.CLOCK:
-                error_message += " Make sure property is a positive integer."
-            elif vararg == self.devices.SIGGEN:
-                error_message += (" Make sure property contains "
-                                  "only '0's and '1's.")
-            elif (vararg in self.devices.gate_types and
-                  vararg != self.devices.XOR):
-                error_message += (" Make sure property is "
-                                  "an integer less than 17 "
-                                  "(and greater than 0).")
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.devices.NO_QUALIFIER:
-            error_message += "Expected a property for the device."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.devices.BAD_DEVICE:
-            error_message += ("Something went wrong adding this device "
-                              "to the network.")
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.devices.QUALIFIER_PRESENT:
-            error_message += "Property not required for this device."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-        elif error_type == self.devices.DEVICE_PRESENT:
-            error_message += "This device already exists."
-            stopping_symbol.extend([self.scanner.SEMI_COLON,
-                                    self.scanner.END])
-
         l = self.symbol.linenum
         c = self.symbol.colnum
 
         if advance_symbol:
             while self.symbol.id not in stopping_symbol:
-                self.symbol = self.scanner.get_symbol()
+                self.symbol = self.get_symbol()
             stop = self.symbol.id
-            if self.symbol.id != self.scanner.EOF:
-                self.symbol = self.scanner.get_symbol()
-                error_message += (" Parsing resumed on line " +
-                                  str(self.symbol.linenum) + ".")
+            if self.symbol.id != self.EOF:
+                self.symbol = self.get_symbol()
+                resumed_linenum = self.symbol.linenum
             else:
                 self.reached_eof = True
 
-        error_message += "***\n"
-        self.error_messages.append((error_message, l, c))
+        # The message is only built if the error report is displayed
+        self.error_messages.append((error_type, vararg, resumed_linenum,
+                                    l, c))
         return stop
 
+    def format_error(self, error_type, vararg, resumed_linenum):
+        """Return the message for an error the parser has encountered."""
+
+        message = self.error_table.get(error_type, ("", None))[0]
+        argument = self.error_arguments.get(error_type)
+        if argument is not None:
+            message = message.format(argument(vararg))
+        if resumed_linenum is not None:
+            message += f" Parsing resumed on line {resumed_linenum}."
+        return f"***Error: {message}***\n"
+
     def error_report(self):
         """Build and display the error report."""
 
-        for i in self.error_messages:
-            s = self.scanner.print_line(i[1], i[2])
-            message = "---------\n"
-            message += "In line " + str(i[1]) + ":\n" + s + "\n"
-            print(message + i[0] + "---------\n")
+        print_line = self.scanner.print_line
+        for (error_type, vararg, resumed_linenum,
+             linenum, colnum) in self.error_messages:
+            error_message = self.format_error(error_type, vararg,
+                                              resumed_linenum)
+            line = print_line(linenum, colnum)
+            print(f"---------\nIn line {linenum}:\n{line}\n"
+                  f"{error_message}---------\n")
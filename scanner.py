@@ -9,7 +9,22 @@ Scanner - reads definition file and translates characters into symbols.
 Symbol - encapsulates a symbol and stores its properties.
 """
 
-import os
+import itertools
+import re
+import sys
+
+# Every piece of the definition file, in order of priority.  Whitespace and
+# comments are skipped, as is a '/' that does not start a comment along with
+# the character after it.  A '-' that does not start an arrow is an invalid
+# symbol and also swallows the character after it.
+TOKEN = re.compile(r"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?(?:\*/|\Z)|/.?)
+  | (?P<number>\d+)
+  | (?P<name>[^\W\d_]\w*)
+  | (?P<arrow>->)
+  | (?P<dash>-\S?)
+  | (?P<other>.)
+""", re.DOTALL | re.VERBOSE)
 
 
 class Symbol:
@@ -27,6 +42,9 @@ class Symbol:
     No public methods.
     """
 
+    # One symbol is made for every token in the file, so keep them small
+    __slots__ = ('type', 'id', 'linenum', 'colnum')
+
     def __init__(self, type, id, linenum, colnum):
         """Initialise symbol properties."""
         self.type = type
@@ -51,10 +69,10 @@ class Scanner:
 
     Public methods
     -------------
-    get_next_character(self): getting the next character in definition file
-    get_next_non_whitespace_character(self): getting the next non-white space
-                                             character in definition file
-    comment_check(self): function to set up the comment skipping
+    word_id(self, word): Returns the name ID of a word read from the
+                         definition file.
+    tokenize_all(self): Translates the whole definition file into a list of
+                        symbols, ending with the EOF symbol.
     get_symbol(self): Translates the next sequence of characters into a symbol
                       and returns the symbol.
     print_line(self, linnum, colnum): function which returns a formatted
@@ -63,16 +81,21 @@ class Scanner:
     """
 
     def __init__(self, path, names):        # add path, names
-        """Open specified file and initialise reserved words and IDs."""
+        """Read specified file and initialise reserved words and IDs."""
 
-        self.filesize = os.path.getsize(path)
-        self.current_position = 0
-        self.defi_file = open(path)
+        # The whole definition file is small enough to hold in memory
+        with open(path) as defi_file:
+            self.source = defi_file.read()
+        self.filesize = len(self.source)
         self.names = names
-        self.current_char = " "
-        self.line_counter = 1
-        self.col_counter = 0
-        self.comment_switch = 0
+        self.next_symbol = None  # set up by the first call to get_symbol
+        self.word_ids = {}  # name ID of each word already read
+
+        # Position of the start of each line, then the end of the file
+        self.line_starts = [0]
+        self.line_starts.extend(match.end()
+                                for match in re.finditer("\n", self.source))
+        self.line_starts.append(self.filesize)
 
         LIST_KEYWORD = ['DEVICE_LIST', 'CONNECTION_LIST', 'MONITOR_LIST',
                         'END']
@@ -80,7 +103,7 @@ class Scanner:
                           'SWITCH', 'SIGGEN']
         PUNCTUATION = [':', ';', '->', '.']
         INITIAL_STATE = ['OFF', 'ON']
-        [self.EOF] = self.names.lookup([""])
+        self.EOF = self.names.lookup_one("")
         self.types = [self.KEYWORDS, self.DEVICETYPE, self.NAMES,
                       self.PROPERTY, self.NUMBER, self.CL, self.SCL,
                       self.AR, self.PE] = range(9)
@@ -96,141 +119,139 @@ class Scanner:
                                 self.SWITCH, self.SIGGEN
                                 ] = self.names.lookup(DEVICE_KEYWORD)
 
-    def get_next_character(self):
-        """getting the next character in definition file"""
-        charac = self.defi_file.read(1)
-        self.col_counter += 1
-        self.current_position += 1
-        if charac == "\n":
-            self.line_counter += 1
-            self.col_counter = 0
-            if self.comment_switch == 1:
-                self.comment_switch = 0
-        return charac
-
-    def get_next_non_whitespace_character(self):
-        """getting the next non-white space character in definition file"""
-        for i in range(self.current_position, self.filesize):
-            charac = self.get_next_character()
-            if not charac.isspace():
-                return charac
-
-    def comment_check(self):
-        """function to set up the comment skipping"""
-        if self.current_char == '/':
-            self.current_char = self.get_next_character()
-            if self.current_char == '/':                  # single line comment
-                self.comment_switch = 1
-            if self.current_char == '*':                  # multi line comment
-                self.comment_switch = 2
-            self.current_char = self.get_next_non_whitespace_character()
-            while self.comment_switch != 0:
-                if not self.current_char:
-                    break
-                if self.comment_switch == 2:
-                    if self.current_char == '*':
-                        self.current_char = self.get_next_character()
-                        if self.current_char == '/':
-                            self.comment_switch = 0
-                self.current_char = self.get_next_non_whitespace_character()
-            self.comment_check()
-
-    def get_symbol(self):
-        """function to return the next symbol and its parameters in a class
-        for each symbol in the definition file
+        # Sets of the reserved word IDs, for fast membership tests in parsing
+        self.keywords_set = frozenset(self.keywords_list)
+        self.device_keywords_set = frozenset(self.device_keywords)
+
+        # Symbol type and ID of each reserved word
+        self.reserved_words = {}
+        for type, words, ids in ((self.KEYWORDS, LIST_KEYWORD,
+                                  self.keywords_list),
+                                 (self.DEVICETYPE, DEVICE_KEYWORD,
+                                  self.device_keywords),
+                                 (self.PROPERTY, INITIAL_STATE,
+                                  self.initial_states)):
+            for word, id in zip(words, ids):
+                self.reserved_words[word] = (type, id)
+
+        # Symbol type and ID of each single character punctuation mark
+        self.punctuation_symbols = {':': (self.CL, self.COLON),
+                                    ';': (self.SCL, self.SEMI_COLON),
+                                    '.': (self.PE, self.PERIOD)}
+
+    def word_id(self, word):
+        """Return the name ID of a word read from the definition file.
+
+        Each distinct word is only looked up in names the first time it is
+        read.
         """
-        type = None
-        id = None
-
-        if not self.current_char:
-            return Symbol(None, self.EOF, self.line_counter, self.col_counter)
-
-        if self.current_char.isspace():
-            self.current_char = self.get_next_non_whitespace_character()
-
-        self.comment_check()
-
-        colnum = self.col_counter
-        linenum = self.line_counter
-
-        if not self.current_char:
-            return Symbol(None, self.EOF, self.line_counter, self.col_counter)
-
-        if self.current_char.isdigit():
-            num_string = ""
-            while self.current_char.isdigit():
-                num_string += str(self.current_char)
-                self.current_char = self.get_next_character()
-            type = self.NUMBER
-            [id] = self.names.lookup([num_string])
-
-        elif self.current_char.isalpha():
-            word = ""
-            while self.current_char.isalnum() or self.current_char == '_':
-                word += self.current_char
-                self.current_char = self.get_next_character()
-            [id] = self.names.lookup([word])
-
-            if id in self.keywords_list:
-                type = self.KEYWORDS
-
-            elif id in self.device_keywords:
-                type = self.DEVICETYPE
-
-            elif id in self.initial_states:
-                type = self.PROPERTY
-
-            else:
-                type = self.NAMES
-
-        else:
-            if self.current_char == ':':
-                type = self.CL
-                id = self.COLON
-
-            elif self.current_char == ';':
-                type = self.SCL
-                id = self.SEMI_COLON
+        id = self.word_ids.get(word)
+        if id is None:
+            id = self.names.lookup_one(word)
+            self.word_ids[word] = id
+        return id
+
+    def tokenize_all(self):
+        """Translate the whole definition file into a list of symbols.
+
+        The list ends with the EOF symbol, which is placed just after the
+        last character in the file.
+
+        Every word in the file gets its name ID here, before parsing adds
+        names of its own, such as the gate inputs "I1" and "I2".  Name IDs
+        therefore follow the order in which words first appear in the file,
+        not the order in which the parser reaches them.
+        """
+        # Bind what the loop uses to locals, which are the cheapest to read
+        source = self.source
+        word_id = self.word_id
+        intern = sys.intern
+        get_punctuation = self.punctuation_symbols.get
+        get_reserved = self.reserved_words.get
+        symbols = []
+        append = symbols.append
+        linenum = 1
+        line_start = 0  # position of the first character on the line
+
+        for match in TOKEN.finditer(source):
+            kind = match.lastgroup
+            start = match.start()
+
+            if kind == 'skip':
+                end = match.end()
+                newlines = source.count('\n', start, end)
+                if newlines:
+                    linenum += newlines
+                    line_start = source.rfind('\n', start, end) + 1
+                continue
+
+            # Repeated words share one string, so comparing them in names
+            # is an identity check
+            text = intern(match.group())
+            type = None
+            id = None
+
+            if kind == 'number':
+                type = self.NUMBER
+                id = word_id(text)
+
+            elif kind == 'name':
+                reserved = get_reserved(text)
+                if reserved is not None:
+                    type, id = reserved
+                else:
+                    type = self.NAMES
+                    id = word_id(text)
 
-            elif self.current_char == '.':
-                type = self.PE
-                id = self.PERIOD
+            elif kind == 'arrow':
+                type = self.AR
+                id = self.ARROW
 
-            elif self.current_char == '-':
-                self.current_char = self.get_next_character()
-                if self.current_char == '>':
-                    type = self.AR
-                    id = self.ARROW
+            elif kind == 'other':
+                punctuation = get_punctuation(text)
+                if punctuation is not None:
+                    type, id = punctuation
+                else:
+                    id = word_id(text)
 
-            else:
-                [id] = self.names.lookup([str(self.current_char)])
+            append(Symbol(type, id, linenum, start - line_start + 1))
 
-            self.current_char = self.get_next_character()
+        append(Symbol(None, self.EOF, linenum,
+                      self.filesize - line_start + 1))
+        return symbols
 
-        return Symbol(type, id, linenum, colnum)
+    def get_symbol(self):
+        """function to return the next symbol and its parameters in a class
+        for each symbol in the definition file
+        """
+        if self.next_symbol is None:
+            # Tokenize the whole file on the first call, then hand out one
+            # symbol per call, with EOF repeated once the list is used up
+            symbols = self.tokenize_all()
+            self.next_symbol = itertools.chain(
+                symbols, itertools.repeat(symbols[-1])).__next__
+        return self.next_symbol()
 
     def print_line(self, linnum, colnum):
         """function which returns a formatted string at the specified location
         for error messages
         """
-        self.defi_file.seek(0)
-        line_string = ""
-        i = 1
-        for line in self.defi_file:
-            if i == linnum:
-                linesize = len(line)
-                if colnum < 37 or linesize < 73:
-                    line_string = line
-                    blanks = " " * (colnum - 1)
-                elif colnum + 37 > linesize:
-                    line_string = "..." + line[linesize - 73:]
-                    blanks = " " * (colnum - linesize + 75)
-                else:
-                    line_string = ("..." +
-                                   line[colnum - 36: colnum + 37] +
-                                   "...\n")
-                    blanks = " " * 38
-                print_string = "".join([line_string, blanks, "^"])
-                return print_string
-            i += 1
-        return "\n^"
+        line_starts = self.line_starts
+        if (not 1 <= linnum < len(line_starts) or
+                line_starts[linnum - 1] == self.filesize):
+            return "\n^"
+
+        line = self.source[line_starts[linnum - 1]:line_starts[linnum]]
+        linesize = len(line)
+        if colnum < 37 or linesize < 73:
+            line_string = line
+            blanks = " " * (colnum - 1)
+        elif colnum + 37 > linesize:
+            line_string = "..." + line[linesize - 73:]
+            blanks = " " * (colnum - linesize + 75)
+        else:
+            line_string = ("..." +
+                           line[colnum - 36: colnum + 37] +
+                           "...\n")
+            blanks = " " * 38
+        return "".join([line_string, blanks, "^"])
@@ -154,6 +154,45 @@ def test_reset_monitors(new_monitors):
                                                 (OR1_ID, None): []}
 
 
+def test_traces_uint8(new_monitors):
+    """Test if traces_uint8 mirrors the signal lists of all the monitors."""
+    names = new_monitors.names
+    devices = new_monitors.devices
+    network = new_monitors.network
+    [SW1_ID, SW2_ID, OR1_ID] = names.lookup(["Sw1", "Sw2", "Or1"])
+
+    HIGH = devices.HIGH
+    LOW = devices.LOW
+    BLANK = devices.BLANK
+
+    network.execute_network()
+    new_monitors.record_signals()
+    devices.set_switch(SW1_ID, HIGH)
+    network.execute_network()
+    new_monitors.record_signals()
+
+    # A monitor made after two cycles starts with two BLANK signals
+    new_monitors.remove_monitor(SW2_ID, None)
+    new_monitors.make_monitor(SW2_ID, None, 2)
+    new_monitors.record_signals()
+
+    traces = {key: list(trace)
+              for key, trace in new_monitors.traces_uint8.items()}
+    assert traces == new_monitors.monitors_dictionary == {
+        (SW1_ID, None): [LOW, HIGH, HIGH],
+        (OR1_ID, None): [LOW, HIGH, HIGH],
+        (SW2_ID, None): [BLANK, BLANK, LOW]}
+    assert list(new_monitors.traces_uint8) == list(
+        new_monitors.monitors_dictionary)
+
+    new_monitors.reset_monitors()
+    traces = {key: list(trace)
+              for key, trace in new_monitors.traces_uint8.items()}
+    assert traces == {(SW1_ID, None): [],
+                      (OR1_ID, None): [],
+                      (SW2_ID, None): []}
+
+
 def test_display_signals(capsys, new_monitors):
     """Test if signal traces are displayed correctly on the console."""
     names = new_monitors.names
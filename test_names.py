@@ -29,17 +29,20 @@ def test_lookup(used_names, test_name_string, expected_idlist, new_name_string,
     assert Names().lookup(new_name_string) == new_idlist
 
 
-@pytest.mark.parametrize("name_id, expected_string", [("(0)", "Alice")])
+def test_lookup_one(used_names):
+    """testing the lookup_one function in names module"""
+    assert used_names.lookup_one("Bob") == 1
+    assert used_names.lookup_one("steve") == 3
+    assert used_names.lookup_one("steve") == 3
+
+
+@pytest.mark.parametrize("name_id, expected_string", [(0, "Alice")])
 def test_get_string(used_names, name_id, expected_string):
     """testing the get_name_string function in the names module"""
-    left = eval("".join(["used_names.get_name_string", name_id]))
-    right = expected_string
-    assert left == right
+    assert used_names.get_name_string(name_id) == expected_string
 
 
-@pytest.mark.parametrize("name_string, id", [("('Alice')", 0), ("('Bob')", 1)])
+@pytest.mark.parametrize("name_string, id", [("Alice", 0), ("Bob", 1)])
 def test_query(used_names, name_string, id):
     """testing the query function in the names module"""
-    left = eval("".join(["used_names.query", name_string]))
-    right = id
-    assert left == id
+    assert used_names.query(name_string) == id
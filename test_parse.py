@@ -16,30 +16,27 @@ file_device = "testFiles/device.txt"
 file_connect = "testFiles/connect.txt"
 
 
+def make_parser(path):
+    """Return a new instance of the Parse class reading the file at path."""
+    names = Names()
+    scanner = Scanner(path, names)
+    devices = Devices(names)
+    network = Network(names, devices)
+    monitors = Monitors(names, devices, network)
+    return Parser(names, devices, network, monitors, scanner)
+
+
 @pytest.fixture
 def parser():
     """Return a new instance of the Parse class."""
-    new_names = Names()
-    new_scanner = Scanner(file_no_errors, new_names)
-    new_devices = Devices(new_names)
-    new_network = Network(new_names, new_devices)
-    new_monitors = Monitors(new_names, new_devices, new_network)
-    new_parser = Parser(new_names, new_devices, new_network,
-                        new_monitors, new_scanner)
-
-    return new_parser
+    return make_parser(file_no_errors)
 
 
 @pytest.fixture
 def new_parser():
     """Return a new instance of the Parse class."""
-    new_names = Names()
-    new_scanner = Scanner(file_no_errors, new_names)
-    new_devices = Devices(new_names)
-    new_network = Network(new_names, new_devices)
-    new_monitors = Monitors(new_names, new_devices, new_network)
-    new_parser = Parser(new_names, new_devices, new_network,
-                        new_monitors, new_scanner)
+    new_parser = make_parser(file_no_errors)
+    new_devices = new_parser.devices
 
     # Initially populate new_devices with some devices
     [AND_ID, NOR_ID,
@@ -56,27 +53,14 @@ def new_parser():
 @pytest.fixture
 def new_parser_with_errors():
     """Return a new instance of the Parse class."""
-    new_names = Names()
-    new_scanner = Scanner(file_errors, new_names)
-    new_devices = Devices(new_names)
-    new_network = Network(new_names, new_devices)
-    new_monitors = Monitors(new_names, new_devices, new_network)
-    new_parser = Parser(new_names, new_devices, new_network,
-                        new_monitors, new_scanner)
-
-    return new_parser
+    return make_parser(file_errors)
 
 
 @pytest.fixture
 def parser_io():
     """Return a new instance of the Parse class."""
-    names = Names()
-    scanner = Scanner(file_io, names)
-    devices = Devices(names)
-    network = Network(names, devices)
-    monitors = Monitors(names, devices, network)
-    new_parser = Parser(names, devices, network,
-                        monitors, scanner)
+    new_parser = make_parser(file_io)
+    devices = new_parser.devices
 
     # Initially populate new_devices with some devices
     [new_parser.DT] = new_parser.names.lookup(["d1"])
@@ -89,27 +73,14 @@ def parser_io():
 @pytest.fixture
 def parser_device():
     """Return a new instance of the Parse class."""
-    names = Names()
-    scanner = Scanner(file_device, names)
-    devices = Devices(names)
-    network = Network(names, devices)
-    monitors = Monitors(names, devices, network)
-    new_parser = Parser(names, devices, network,
-                        monitors, scanner)
-
-    return new_parser
+    return make_parser(file_device)
 
 
 @pytest.fixture
 def parser_connect():
     """Return a new instance of the Parse class."""
-    names = Names()
-    scanner = Scanner(file_connect, names)
-    devices = Devices(names)
-    network = Network(names, devices)
-    monitors = Monitors(names, devices, network)
-    new_parser = Parser(names, devices, network,
-                        monitors, scanner)
+    new_parser = make_parser(file_connect)
+    devices = new_parser.devices
 
     [clk, dt] = new_parser.names.lookup(["CLK", "D1"])
     new_parser.devices.make_device(clk, devices.CLOCK, 10)
@@ -129,23 +100,37 @@ def test_check_valid_name(new_parser):
     assert not new_parser.check_valid_name(CLK)
     assert new_parser.check_valid_name(SPAM)
 
-@pytest.mark.parametrize("function_args, device_type, returns", [
-    ("(scanner.PROPERTY, prop1, 0, 0)", "(devices.SWITCH)", "devices.LOW"),
-    ("(scanner.NUMBER, prop2, 0, 0)", "(devices.AND)", "3"),
-    ("(scanner.NAMES, prop3, 0, 0)", "(devices.AND)", "None"),
-    ("(scanner.NUMBER, prop4, 0, 0)", "(devices.SIGGEN)", "'0110'"),
+@pytest.mark.parametrize("property, state", [
+    ("OFF", "LOW"),
+    ("ON", "HIGH"),
+])
+def test_get_property_switch(new_parser, property, state):
+    """Test get_property for the initial state of a switch"""
+    names = new_parser.names
+    scanner = new_parser.scanner
+    devices = new_parser.devices
+    prop = names.lookup_one(property)
+
+    new_parser.symbol = Symbol(scanner.PROPERTY, prop, 0, 0)
+    assert (new_parser.get_property(devices.SWITCH) ==
+            getattr(devices, state))
+
+
+@pytest.mark.parametrize("symbol_type, property, device_type, returns", [
+    ("NUMBER", "3", "AND", 3),
+    ("NAMES", "foo", "AND", None),
+    ("NUMBER", "0110", "SIGGEN", "0110"),
 ])
-def test_get_property(new_parser, function_args, device_type, returns):
+def test_get_property(new_parser, symbol_type, property, device_type,
+                      returns):
     """Test get_property"""
     names = new_parser.names
     scanner = new_parser.scanner
     devices = new_parser.devices
-    [prop1, prop2, prop3, prop4] = names.lookup(["OFF", "3", "foo", "0110"])
+    prop = names.lookup_one(property)
 
-    new_parser.symbol = eval("".join(["Symbol", function_args]))
-    left_expression = eval("".join(["new_parser.get_property", device_type]))
-    right_expression = eval(returns)
-    assert left_expression == right_expression
+    new_parser.symbol = Symbol(getattr(scanner, symbol_type), prop, 0, 0)
+    assert new_parser.get_property(getattr(devices, device_type)) == returns
 
 
 def test_get_io(parser_io):
@@ -160,7 +145,7 @@ def test_get_io(parser_io):
 
     [AND] = names.lookup(["and"])
     parser_io.symbol = Symbol(scanner.NAMES, AND, 0, 0)
-    assert parser_io.get_io(parser_io.OUTPUT) == (None, None)
+    assert parser_io.get_io(parser_io.OUTPUT) is None
 
 
 def test_device(parser_device):
@@ -191,16 +176,16 @@ def test_check_keyword(new_parser):
     assert not new_parser.check_keyword(scanner.MONITOR_LIST)
 
 
-def test_build_list(parser_device):
-    """Test build_list"""
+def test_parse_list(parser_device):
+    """Test parse_list"""
     scanner = parser_device.scanner
     parser_device.symbol = scanner.get_symbol()
 
-    assert parser_device.build_list(scanner.DEVICETYPE,
+    assert parser_device.parse_list(scanner.DEVICETYPE,
                                     parser_device.device)
 
     parser_device.symbol = Symbol(scanner.NUMBER, 1, 0, 0)
-    assert not parser_device.build_list(scanner.DEVICETYPE,
+    assert not parser_device.parse_list(scanner.DEVICETYPE,
                                         parser_device.device)
 
 
@@ -211,19 +196,18 @@ def test_lists(parser):
     assert parser.connectionlist()
 
 
-@pytest.mark.parametrize("function_args, error",[
-    ("(parser.KEYWORD_ERROR,True, scanner.CONNECTION_LIST)", "scanner.END"),
-    ("(parser.SYMBOL_TYPE_ERROR, True, parser.NAMES)", "scanner.SEMI_COLON"),
+@pytest.mark.parametrize("error_type, vararg, error", [
+    ("KEYWORD_ERROR", lambda parser: parser.scanner.CONNECTION_LIST, "END"),
+    ("SYMBOL_TYPE_ERROR", lambda parser: parser.NAMES, "SEMI_COLON"),
 ])
-def test_error(new_parser_with_errors, function_args, error):
+def test_error(new_parser_with_errors, error_type, vararg, error):
     """Test the error funciton"""
     parser = new_parser_with_errors
     scanner = parser.scanner
     parser.symbol = scanner.get_symbol()
 
-    left_expression = eval("".join(["parser.error", function_args]))
-    right_expression = eval(error)
-    assert left_expression == right_expression
+    assert parser.error(getattr(parser, error_type), True,
+                        vararg(parser)) == getattr(scanner, error)
 
 
 def test_parse_network(parser):
@@ -234,3 +218,31 @@ def test_parse_network(parser):
 def test_parse_network_with_errors(new_parser_with_errors):
     """Test parse_network"""
     assert not new_parser_with_errors.parse_network()
+
+
+@pytest.mark.parametrize("definition, report", [
+    # Syntax error: a second device name where a ';' should be
+    ("DEVICE_LIST: DTYPE D1 D2;\nEND\nCONNECTION_LIST: END\n"
+     "MONITOR_LIST: END\n",
+     "In line 1:\n"
+     "DEVICE_LIST: DTYPE D1 D2;\n"
+     "                      ^\n"
+     "***Error: Expected a ';'. Parsing resumed on line 2.***\n"),
+    # Semantic error: a connection from a device that was never made
+    ("DEVICE_LIST: DTYPE D1; END\nCONNECTION_LIST: X1 -> D1.DATA; END\n"
+     "MONITOR_LIST: D1.Q; END\n",
+     "In line 2:\n"
+     "CONNECTION_LIST: X1 -> D1.DATA; END\n"
+     "                 ^\n"
+     "***Error: This does not match a known device. "
+     "Parsing resumed on line 2.***\n"),
+])
+def test_error_report(tmp_path, capsys, definition, report):
+    """Test the messages printed by error_report"""
+    defi_file = tmp_path / "defi.txt"
+    defi_file.write_text(definition)
+    parser = make_parser(str(defi_file))
+
+    assert not parser.parse_network()
+    assert "".join(["---------\n", report, "---------\n"]) in (
+        capsys.readouterr().out)
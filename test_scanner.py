@@ -6,10 +6,15 @@ from scanner import Symbol
 from scanner import Scanner
 
 path = 'testFiles/testfile_scanner.txt'
-scan = Scanner(path, Names())
 
 
-def test_keyword():
+@pytest.fixture(scope="module")
+def scan():
+    """scanner shared by the tests below, which read its symbols in turn"""
+    return Scanner(path, Names())
+
+
+def test_keyword(scan):
     """testing keywords scanning in scanner module"""
     symbol = scan.get_symbol()
     assert symbol.type == 0
@@ -17,7 +22,7 @@ def test_keyword():
     assert symbol.linenum == 1
 
 
-def test_colon():
+def test_colon(scan):
     """testing colon scanning in scanner module"""
     symbol = scan.get_symbol()
     assert symbol.type == 5
@@ -25,7 +30,7 @@ def test_colon():
     assert symbol.linenum == 1
 
 
-def test_devicetype_():
+def test_devicetype_(scan):
     """testing devicetype scanning in scanner module"""
     symbol = scan.get_symbol()
     assert symbol.type == 1
@@ -33,7 +38,7 @@ def test_devicetype_():
     assert symbol.linenum == 1
 
 
-def test_names():
+def test_names(scan):
     """testing name scanning in scanner module"""
     symbol = scan.get_symbol()
     assert symbol.type == 2
@@ -41,7 +46,7 @@ def test_names():
     assert symbol.linenum == 1
 
 
-def test_number():
+def test_number(scan):
     """testing number scanning in scanner module"""
     symbol = scan.get_symbol()
     assert symbol.type == 4
@@ -49,7 +54,7 @@ def test_number():
     assert symbol.linenum == 1
 
 
-def test_semi_colon():
+def test_semi_colon(scan):
     """testing semi-colon scanning in scanner module"""
     symbol = scan.get_symbol()
     assert symbol.type == 6
@@ -57,7 +62,7 @@ def test_semi_colon():
     assert symbol.linenum == 1
 
 
-def test_initial_states():
+def test_initial_states(scan):
     """testing initial states scanning in scanner module"""
     scan.get_symbol()
     scan.get_symbol()
@@ -71,7 +76,7 @@ def test_initial_states():
     assert symbol.linenum == 1
 
 
-def test_arrow():
+def test_arrow(scan):
     """testing arrow scanning in scanner module"""
     scan.get_symbol()
     scan.get_symbol()
@@ -88,10 +93,94 @@ def test_arrow():
     assert symbol.linenum == 4
 
 
-def test_period():
+def test_period(scan):
     """testing period scanning in scanner module"""
     scan.get_symbol()
     symbol = scan.get_symbol()
     assert symbol.type == 8
     assert symbol.id == 4
     assert symbol.linenum == 4
+
+
+def tokens(tmp_path, text):
+    """Return the names and symbols read from a file holding text"""
+    defi_file = tmp_path / "defi.txt"
+    defi_file.write_text(text)
+    names = Names()
+    return names, Scanner(str(defi_file), names).tokenize_all()
+
+
+def test_stray_slash_and_dash(tmp_path):
+    """testing a stray '/' or '-' swallows the character after it"""
+    names, symbols = tokens(tmp_path, "a /b c -d e")
+    [a, c, e] = names.lookup(["a", "c", "e"])
+    assert [symbol.id for symbol in symbols[:-1]] == [a, c, None, e]
+    assert symbols[2].type is None
+    assert names.query("b") is None
+    assert names.query("d") is None
+
+
+def test_unterminated_comment(tmp_path):
+    """testing an unterminated block comment runs to the end of the file"""
+    names, symbols = tokens(tmp_path, "a /* b c")
+    assert len(symbols) == 2
+    assert symbols[0].id == names.query("a")
+    assert names.query("b") is None
+
+
+def test_comment_terminator(tmp_path):
+    """testing a block comment ending in '**/' is closed"""
+    names, symbols = tokens(tmp_path, "a /* b **/ c")
+    assert [symbol.id for symbol in symbols[:-1]] == names.lookup(["a", "c"])
+
+
+def test_line_and_column(tmp_path):
+    """testing line and column numbers across comments and blank lines"""
+    names, symbols = tokens(tmp_path, "// comment\n\nDEVICE_LIST: /* x\n"
+                                      " y */ AND a;\n")
+    assert [(symbol.linenum, symbol.colnum) for symbol in symbols[:-1]] == [
+        (3, 1), (3, 12), (4, 7), (4, 11), (4, 12)]
+
+
+@pytest.mark.parametrize("text, linenum, colnum", [
+    ("a;", 1, 3),
+    ("a;  ", 1, 5),
+    ("a;\n", 2, 1),
+    ("a; // comment", 1, 14),
+    ("", 1, 1),
+])
+def test_eof_position(tmp_path, text, linenum, colnum):
+    """testing the EOF symbol is placed just after the last character"""
+    names, symbols = tokens(tmp_path, text)
+    eof = symbols[-1]
+    assert eof.id == names.query("")
+    assert (eof.linenum, eof.colnum) == (linenum, colnum)
+
+
+digits = "1234567890" * 10  # a line too long to print in full
+
+
+@pytest.mark.parametrize("text, linnum, colnum, expected", [
+    # Lines outside the file, including the empty line after a final
+    # newline, where the EOF symbol sits
+    ("ab\ncd\n", 0, 1, "\n^"),
+    ("ab\ncd\n", 4, 1, "\n^"),
+    ("ab\ncd\n", 3, 1, "\n^"),
+    # A last line with no newline after it
+    ("ab\ncd", 2, 3, "cd  ^"),
+    # A short line is printed in full, whatever the column
+    ("ab\ncd\n", 2, 40, "cd\n" + " " * 39 + "^"),
+    # A long line is printed in full up to column 36
+    (digits + "\n", 1, 5, digits + "\n    ^"),
+    # Near the end of a long line only its end is printed
+    (digits + "\n", 1, 90, "..." + digits[28:] + "\n" + " " * 64 + "^"),
+    # Otherwise a window around the column is printed
+    (digits + "\n", 1, 50,
+     "..." + digits[14:87] + "...\n" + " " * 38 + "^"),
+])
+def test_print_line(tmp_path, text, linnum, colnum, expected):
+    """testing the lines printed for error messages"""
+    defi_file = tmp_path / "defi.txt"
+    defi_file.write_text(text)
+    scanner = Scanner(str(defi_file), Names())
+    assert scanner.print_line(linnum, colnum) == expected